@@ -1,25 +1,65 @@
 """AST node definitions for MinimIDL using Pydantic."""
 
-from abc import ABC
 from enum import Enum as PyEnum
-from typing import Any, Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union, get_args
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
+
+# Allowed values for the string-typed fields below; checked by pydantic-core
+PrimitiveTypeName = Literal[
+    "void", "bool", "int32_t", "int64_t", "float", "double", "string_t"
+]
+EnumBackingType = Literal["int32_t", "int64_t"]
+ConstantTypeName = Literal["int32_t", "int64_t", "float", "double"]
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+PRIMITIVE_TYPE_NAMES = frozenset(get_args(PrimitiveTypeName))
+ENUM_BACKING_TYPES = frozenset(get_args(EnumBackingType))
+CONSTANT_TYPES = frozenset(get_args(ConstantTypeName))
 
 
-class ASTNode(BaseModel, ABC):
+class ASTNode(BaseModel):
     """Base class for all AST nodes."""
 
     line: Optional[int] = None
     column: Optional[int] = None
 
+    # Nodes are effectively read-only once built; assignments (e.g. setting
+    # source_file after parsing) are not re-validated.
     model_config = ConfigDict(
         extra="forbid",  # Strict validation
-        validate_assignment=True,
     )
 
 
-class Expression(ASTNode, ABC):
+class _TaggedNode(ASTNode):
+    """Base class for nodes that appear in a tagged union.
+
+    Subclasses declare a ``kind`` literal used as the union discriminator.
+    It is left out of reprs, and out of serialized output when the context
+    is ``{"tags": False}``; output meant to be loaded again must keep it.
+    """
+
+    @model_serializer(mode="wrap")
+    def _serialize_with_kind(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> dict[str, Any]:
+        """Keep ``kind`` when defaults are excluded, unless untagged."""
+        data = handler(self)
+        if info.context is not None and info.context.get("tags") is False:
+            data.pop("kind", None)
+        elif info.exclude_defaults and "kind" not in (info.exclude or ()):
+            # The discriminator always equals its default; loading needs it
+            data["kind"] = self.kind  # type: ignore[attr-defined]
+        return data
+
+
+class Expression(_TaggedNode):
     """Base class for expressions (used in constants and enums)."""
 
     pass
@@ -28,6 +68,7 @@ class Expression(ASTNode, ABC):
 class LiteralExpression(Expression):
     """Literal value expression."""
 
+    kind: Literal["literal"] = Field("literal", repr=False)
     value: Union[int, float, str]
     base: Optional[str] = None  # "hex", "binary", or None for decimal
 
@@ -35,102 +76,107 @@ class LiteralExpression(Expression):
 class IdentifierExpression(Expression):
     """Identifier reference expression."""
 
+    kind: Literal["identifier"] = Field("identifier", repr=False)
     name: str
 
 
 class BinaryExpression(Expression):
     """Binary operation expression."""
 
+    kind: Literal["binary"] = Field("binary", repr=False)
     operator: str  # "+", "-", "*", "/", "%", "<<", ">>", "&", "|"
-    left: Expression
-    right: Expression
+    left: "AnyExpression"
+    right: "AnyExpression"
 
 
 class UnaryExpression(Expression):
     """Unary operation expression."""
 
+    kind: Literal["unary"] = Field("unary", repr=False)
     operator: str  # "+", "-", "~"
-    operand: Expression
+    operand: "AnyExpression"
 
 
 class ParenthesizedExpression(Expression):
     """Parenthesized expression."""
 
-    expression: Expression
+    kind: Literal["parenthesized"] = Field("parenthesized", repr=False)
+    expression: "AnyExpression"
 
 
-class Type(ASTNode, ABC):
+class Type(_TaggedNode):
     """Base class for all type specifications."""
 
     pass
 
 
 class PrimitiveType(Type):
-    """Built-in primitive types."""
+    """Built-in primitive types.
 
-    name: str
+    Frozen because the transformer shares one instance per primitive name
+    across every parsed file.
+    """
 
-    @field_validator("name")
-    @classmethod
-    def validate_primitive(cls, v: str) -> str:
-        """Validate primitive type name."""
-        valid_types = {
-            "void",
-            "bool",
-            "int32_t",
-            "int64_t",
-            "float",
-            "double",
-            "string_t",
-        }
-        if v not in valid_types:
-            raise ValueError(f"Invalid primitive type: {v}")
-        return v
+    model_config = ConfigDict(frozen=True)
+
+    kind: Literal["primitive"] = Field("primitive", repr=False)
+    name: PrimitiveTypeName
 
 
 class TypeRef(Type):
-    """Reference to a user-defined type (interface, enum, typedef)."""
+    """Reference to a user-defined type (interface, enum, typedef).
+
+    Frozen (and therefore hashable) so the transformer can share one instance
+    per referenced name.
+    """
 
+    model_config = ConfigDict(frozen=True)
+
+    kind: Literal["typeref"] = Field("typeref", repr=False)
     name: str
 
 
 class ArrayType(Type):
     """Array type specification."""
 
-    element_type: Type
+    kind: Literal["array"] = Field("array", repr=False)
+    element_type: "AnyType"
 
 
 class DictType(Type):
     """Dictionary type specification."""
 
-    key_type: Type
-    value_type: Type
+    kind: Literal["dict"] = Field("dict", repr=False)
+    key_type: "AnyType"
+    value_type: "AnyType"
 
 
 class SetType(Type):
     """Set type specification."""
 
-    element_type: Type
+    kind: Literal["set"] = Field("set", repr=False)
+    element_type: "AnyType"
 
 
 class NullableType(Type):
     """Nullable type wrapper."""
 
-    inner_type: Type
+    kind: Literal["nullable"] = Field("nullable", repr=False)
+    inner_type: "AnyType"
 
 
 class Parameter(ASTNode):
     """Method parameter definition."""
 
     name: str
-    type: Type
+    type: "AnyType"
 
 
 class Method(ASTNode):
     """Interface method definition."""
 
     name: str
-    return_type: Type
+    return_type: "AnyType"
     parameters: list[Parameter] = Field(default_factory=list)
 
 
@@ -138,7 +184,7 @@ class Property(ASTNode):
     """Interface property definition."""
 
     name: str
-    type: Type
+    type: "AnyType"
     writable: bool = False
 
 
@@ -160,46 +206,29 @@ class EnumValue(ASTNode):
     """Enum member definition."""
 
     name: str
-    value: Expression
+    value: "AnyExpression"
 
 
 class Enum(ASTNode):
     """Enum definition."""
 
     name: str
-    backing_type: str  # int32_t or int64_t
+    backing_type: EnumBackingType
     values: list[EnumValue] = Field(default_factory=list)
 
-    @field_validator("backing_type")
-    @classmethod
-    def validate_backing_type(cls, v: str) -> str:
-        """Validate enum backing type."""
-        if v not in ("int32_t", "int64_t"):
-            raise ValueError(f"Invalid enum backing type: {v}")
-        return v
-
 
 class Typedef(ASTNode):
     """Type alias definition."""
 
     name: str
-    type: Type
+    type: "AnyType"
 
 
 class ConstantValue(ASTNode):
     """Constant value definition."""
 
-    type: str  # int32_t, int64_t, float, double
-    value: Expression
-
-    @field_validator("type")
-    @classmethod
-    def validate_const_type(cls, v: str) -> str:
-        """Validate constant type."""
-        valid_types = {"int32_t", "int64_t", "float", "double"}
-        if v not in valid_types:
-            raise ValueError(f"Invalid constant type: {v}")
-        return v
+    type: ConstantTypeName
+    value: "AnyExpression"
 
 
 class Constant(ASTNode):
@@ -231,14 +260,47 @@ class IDLFile(ASTNode):
 
     namespaces: list[Namespace] = Field(default_factory=list)
     source_file: Optional[str] = None
+    # Hash of the IDL source, used to detect stale cached ASTs
+    source_hash: Optional[str] = None
 
 
-# Type aliases for better readability
-AnyType = Union[PrimitiveType, TypeRef, ArrayType, DictType, SetType, NullableType]
-AnyExpression = Union[
-    LiteralExpression,
-    IdentifierExpression,
+# Tagged unions of the concrete node classes; pydantic dispatches on ``kind``
+# instead of trying each variant in turn
+AnyType = Annotated[
+    Union[PrimitiveType, TypeRef, ArrayType, DictType, SetType, NullableType],
+    Field(discriminator="kind"),
+]
+AnyExpression = Annotated[
+    Union[
+        LiteralExpression,
+        IdentifierExpression,
+        BinaryExpression,
+        UnaryExpression,
+        ParenthesizedExpression,
+    ],
+    Field(discriminator="kind"),
+]
+
+# Resolve the forward references to the unions above
+for _model in (
     BinaryExpression,
     UnaryExpression,
     ParenthesizedExpression,
-]
+    ArrayType,
+    DictType,
+    SetType,
+    NullableType,
+    Parameter,
+    Method,
+    Property,
+    Interface,
+    EnumValue,
+    Enum,
+    Typedef,
+    ConstantValue,
+    Constant,
+    Namespace,
+    IDLFile,
+):
+    _model.model_rebuild()
+del _model
@@ -1,6 +1,5 @@
 """JSON serialization for AST nodes."""
 
-import json
 from pathlib import Path
 from typing import Any, Union
 
@@ -21,12 +20,14 @@ def save_ast(ast: IDLFile, path: Union[str, Path]) -> None:
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert to JSON with Pydantic
-    json_data = ast.model_dump(mode="json", exclude_none=True)
+    # Serialize straight to JSON text in pydantic-core (no intermediate dict);
+    # empty lists and other defaults are restored by the model on load
+    json_text = ast.model_dump_json(
+        indent=2, exclude_none=True, exclude_defaults=True
+    )
 
-    # Write with pretty formatting
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(json_data, f, indent=2, ensure_ascii=False)
+    # Write with pretty formatting in a single call
+    path.write_text(json_text, encoding="utf-8")
 
 
 def load_ast(path: Union[str, Path]) -> IDLFile:
@@ -40,19 +41,15 @@ def load_ast(path: Union[str, Path]) -> IDLFile:
 
     Raises:
         FileNotFoundError: If the file doesn't exist.
-        ValueError: If the JSON is invalid.
+        ValueError: If the JSON is invalid (a ``pydantic.ValidationError``).
     """
     path = Path(path)
 
     if not path.exists():
         raise FileNotFoundError(f"AST file not found: {path}")
 
-    # Read JSON data
-    with open(path, "r", encoding="utf-8") as f:
-        json_data = json.load(f)
-
-    # Convert back to AST using Pydantic
-    return IDLFile.model_validate(json_data)
+    # Let pydantic-core parse the UTF-8 bytes directly (no intermediate dict)
+    return IDLFile.model_validate_json(path.read_bytes())
 
 
 def ast_to_dict(ast: BaseModel) -> dict[str, Any]:
@@ -1,10 +1,20 @@
-"""Transformer to convert Lark parse tree to AST nodes."""
+"""Transformer to convert Lark parse tree to AST nodes.
 
-from typing import Any, Union
+Nodes are built with ``model_construct`` since the grammar already guarantees
+their shape; the only checks the grammar cannot express (enum backing types and
+constant types) are done explicitly here.
+"""
+
+import sys
+from functools import partial
+from typing import Any, Callable, Optional, Union
 
 from lark import Token, Transformer, Tree
 
 from minimidl.ast.nodes import (
+    CONSTANT_TYPES,
+    ENUM_BACKING_TYPES,
+    PRIMITIVE_TYPE_NAMES,
     ArrayType,
     BinaryExpression,
     Constant,
@@ -32,6 +42,62 @@ from minimidl.ast.nodes import (
     UnaryExpression,
 )
 
+# Primitive type token -> IDL primitive name
+_PRIMITIVE_TOKEN_NAMES = {
+    "VOID": "void",
+    "BOOL": "bool",
+    "INT32": "int32_t",
+    "INT64": "int64_t",
+    "FLOAT": "float",
+    "DOUBLE": "double",
+}
+
+# Number token type -> (value parser, LiteralExpression.base)
+_NUMBER_PARSE: dict[str, tuple[Callable[[str], int], Optional[str]]] = {
+    "HEX_NUMBER": (partial(int, base=16), "hex"),
+    "BINARY_NUMBER": (partial(int, base=2), "binary"),
+    "DECIMAL_NUMBER": (int, None),
+}
+
+# Declaration node type -> index of its list in the namespace_body result
+# (interfaces, enums, typedefs, constants, forward_declarations)
+_BUCKET: dict[type, int] = {
+    Interface: 0,
+    Enum: 1,
+    Typedef: 2,
+    Constant: 3,
+    ForwardDeclaration: 4,
+}
+
+# Shared PrimitiveType instances; primitives carry no position so one per name
+_PRIM_CACHE = {
+    name: PrimitiveType.model_construct(name=name) for name in PRIMITIVE_TYPE_NAMES
+}
+
+
+def _fold_implicit(items: list[Expression], operator: str) -> Expression:
+    """Left-fold operands joined by a fixed operator into BinaryExpressions."""
+    result = items[0]
+    for right in items[1:]:
+        result = BinaryExpression.model_construct(
+            operator=operator, left=result, right=right
+        )
+    return result
+
+
+def _left_fold(items: list[Any]) -> Expression:
+    """Left-fold an ``operand (OP operand)*`` list into BinaryExpressions.
+
+    The rules using this are inlined when they have a single operand, so
+    ``items`` always alternates operands with the operator tokens between them.
+    """
+    result = items[0]
+    for i in range(1, len(items), 2):
+        result = BinaryExpression.model_construct(
+            operator=items[i].value, left=result, right=items[i + 1]
+        )
+    return result
+
 
 class IDLTransformer(Transformer):
     """Transform Lark parse tree into AST nodes."""
@@ -41,6 +107,13 @@ class IDLTransformer(Transformer):
         super().__init__()
         self.current_line = 0
         self.current_column = 0
+        # Type name -> shared TypeRef, reset for every transformed tree
+        self._typerefs: dict[str, TypeRef] = {}
+
+    def transform(self, tree: Tree) -> Any:
+        """Transform a parse tree, starting with a fresh TypeRef cache."""
+        self._typerefs = {}
+        return super().transform(tree)
 
     def _update_position(self, item: Union[Token, Tree]) -> tuple[int, int]:
         """Update and return current position from token or tree."""
@@ -55,61 +128,56 @@ class IDLTransformer(Transformer):
     # Entry point
     def start(self, items: list[Namespace]) -> IDLFile:
         """Transform the root node."""
-        return IDLFile(namespaces=items)
+        return IDLFile.model_construct(namespaces=items)
 
     # Namespace
     def namespace_decl(self, items: list[Any]) -> Namespace:
         """Transform namespace declaration."""
-        name = items[0].value
-        namespace_body = items[1]
-        return Namespace(
-            name=name,
-            interfaces=namespace_body.get("interfaces", []),
-            enums=namespace_body.get("enums", []),
-            typedefs=namespace_body.get("typedefs", []),
-            constants=namespace_body.get("constants", []),
-            forward_declarations=namespace_body.get("forward_declarations", []),
-            line=self._update_position(items[0])[0],
-            column=self._update_position(items[0])[1],
+        name_token = items[0]
+        interfaces, enums, typedefs, constants, forward_declarations = items[1]
+        line, column = self._update_position(name_token)
+        return Namespace.model_construct(
+            name=name_token.value,
+            interfaces=interfaces,
+            enums=enums,
+            typedefs=typedefs,
+            constants=constants,
+            forward_declarations=forward_declarations,
+            line=line,
+            column=column,
         )
 
-    def namespace_body(self, items: list[Any]) -> dict[str, list[Any]]:
-        """Transform namespace body."""
-        result: dict[str, list[Any]] = {
-            "interfaces": [],
-            "enums": [],
-            "typedefs": [],
-            "constants": [],
-            "forward_declarations": [],
-        }
+    def namespace_body(self, items: list[Any]) -> tuple[list[Any], ...]:
+        """Transform namespace body.
+
+        Returns:
+            The (interfaces, enums, typedefs, constants, forward_declarations)
+            lists, in that order.
+        """
+        result: tuple[list[Any], ...] = ([], [], [], [], [])
 
         for item in items:
-            if isinstance(item, Interface):
-                result["interfaces"].append(item)
-            elif isinstance(item, Enum):
-                result["enums"].append(item)
-            elif isinstance(item, Typedef):
-                result["typedefs"].append(item)
-            elif isinstance(item, Constant):
-                result["constants"].append(item)
-            elif isinstance(item, ForwardDeclaration):
-                result["forward_declarations"].append(item)
+            bucket = _BUCKET.get(type(item))
+            if bucket is not None:
+                result[bucket].append(item)
 
         return result
 
     # Forward declaration
     def forward_decl(self, items: list[Any]) -> ForwardDeclaration:
         """Transform forward declaration."""
-        return ForwardDeclaration(
-            name=items[0].value,
-            line=self._update_position(items[0])[0],
-            column=self._update_position(items[0])[1],
+        name_token = items[0]
+        line, column = self._update_position(name_token)
+        return ForwardDeclaration.model_construct(
+            name=name_token.value,
+            line=line,
+            column=column,
         )
 
     # Interface
     def interface_decl(self, items: list[Any]) -> Interface:
         """Transform interface declaration."""
-        name = items[0].value
+        name_token = items[0]
         methods = []
         properties = []
 
@@ -119,31 +187,29 @@ class IDLTransformer(Transformer):
             elif isinstance(item, Property):
                 properties.append(item)
 
-        return Interface(
-            name=name,
+        line, column = self._update_position(name_token)
+        return Interface.model_construct(
+            name=name_token.value,
             methods=methods,
             properties=properties,
-            line=self._update_position(items[0])[0],
-            column=self._update_position(items[0])[1],
+            line=line,
+            column=column,
         )
 
-    def interface_member(self, items: list[Any]) -> Union[Method, Property]:
-        """Transform interface member."""
-        return items[0]
-
     # Property
     def property_decl(self, items: list[Any]) -> Property:
         """Transform property declaration."""
         type_spec = items[0]
-        name = items[1].value
+        name_token = items[1]
         writable = len(items) > 2 and items[2] is not None
 
-        return Property(
-            name=name,
+        line, column = self._update_position(name_token)
+        return Property.model_construct(
+            name=name_token.value,
             type=type_spec,
             writable=writable,
-            line=self._update_position(items[1])[0],
-            column=self._update_position(items[1])[1],
+            line=line,
+            column=column,
         )
 
     def writable(self, items: list[Any]) -> bool:
@@ -154,15 +220,16 @@ class IDLTransformer(Transformer):
     def method_decl(self, items: list[Any]) -> Method:
         """Transform method declaration."""
         return_type = items[0]
-        name = items[1].value
+        name_token = items[1]
         parameters = items[2] if len(items) > 2 and items[2] else []
 
-        return Method(
-            name=name,
+        line, column = self._update_position(name_token)
+        return Method.model_construct(
+            name=name_token.value,
             return_type=return_type,
             parameters=parameters,
-            line=self._update_position(items[1])[0],
-            column=self._update_position(items[1])[1],
+            line=line,
+            column=column,
         )
 
     def parameter_list(self, items: list[Parameter]) -> list[Parameter]:
@@ -171,29 +238,35 @@ class IDLTransformer(Transformer):
 
     def parameter(self, items: list[Any]) -> Parameter:
         """Transform parameter."""
-        return Parameter(
+        name_token = items[1]
+        line, column = self._update_position(name_token)
+        return Parameter.model_construct(
             type=items[0],
-            name=items[1].value,
-            line=self._update_position(items[1])[0],
-            column=self._update_position(items[1])[1],
+            name=name_token.value,
+            line=line,
+            column=column,
         )
 
     # Enum
     def enum_decl(self, items: list[Any]) -> Enum:
         """Transform enum declaration."""
-        name = items[0].value
+        name_token = items[0]
         # backing_type is now a PrimitiveType object
+        backing = items[1]
         backing_type = (
-            items[1].name if isinstance(items[1], PrimitiveType) else items[1].value
+            backing.name if isinstance(backing, PrimitiveType) else backing.value
         )
+        if backing_type not in ENUM_BACKING_TYPES:
+            raise ValueError(f"Invalid enum backing type: {backing_type}")
         values = items[2] if len(items) > 2 and items[2] else []
 
-        return Enum(
-            name=name,
+        line, column = self._update_position(name_token)
+        return Enum.model_construct(
+            name=name_token.value,
             backing_type=backing_type,
             values=values,
-            line=self._update_position(items[0])[0],
-            column=self._update_position(items[0])[1],
+            line=line,
+            column=column,
         )
 
     def enum_member_list(self, items: list[EnumValue]) -> list[EnumValue]:
@@ -202,161 +275,115 @@ class IDLTransformer(Transformer):
 
     def enum_member(self, items: list[Any]) -> EnumValue:
         """Transform enum member."""
-        return EnumValue(
-            name=items[0].value,
+        name_token = items[0]
+        line, column = self._update_position(name_token)
+        return EnumValue.model_construct(
+            name=name_token.value,
             value=items[1],
-            line=self._update_position(items[0])[0],
-            column=self._update_position(items[0])[1],
+            line=line,
+            column=column,
         )
 
     # Typedef
     def typedef_decl(self, items: list[Any]) -> Typedef:
         """Transform typedef declaration."""
-        return Typedef(
+        name_token = items[1]
+        line, column = self._update_position(name_token)
+        return Typedef.model_construct(
             type=items[0],
-            name=items[1].value,
-            line=self._update_position(items[1])[0],
-            column=self._update_position(items[1])[1],
+            name=name_token.value,
+            line=line,
+            column=column,
         )
 
     # Constant
     def const_decl(self, items: list[Any]) -> Constant:
         """Transform constant declaration."""
         # type is now a PrimitiveType object
+        const_type = items[0]
         type_name = (
-            items[0].name if isinstance(items[0], PrimitiveType) else items[0].value
+            const_type.name
+            if isinstance(const_type, PrimitiveType)
+            else const_type.value
         )
-        name = items[1].value
+        if type_name not in CONSTANT_TYPES:
+            raise ValueError(f"Invalid constant type: {type_name}")
+        name_token = items[1]
         value = items[2]
 
-        return Constant(
-            name=name,
-            constant_value=ConstantValue(type=type_name, value=value),
-            line=self._update_position(items[1])[0],
-            column=self._update_position(items[1])[1],
+        line, column = self._update_position(name_token)
+        return Constant.model_construct(
+            name=name_token.value,
+            constant_value=ConstantValue.model_construct(type=type_name, value=value),
+            line=line,
+            column=column,
         )
 
     # Types
-    def type_spec(self, items: list[Type]) -> Type:
-        """Transform type specification."""
-        return items[0]
-
     def nullable_type(self, items: list[Type]) -> NullableType:
         """Transform nullable type."""
-        return NullableType(inner_type=items[0])
-
-    def non_nullable_type(self, items: list[Type]) -> Type:
-        """Transform non-nullable type."""
-        return items[0]
+        return NullableType.model_construct(inner_type=items[0])
 
     def array_type(self, items: list[Type]) -> ArrayType:
         """Transform array type."""
-        return ArrayType(element_type=items[0])
+        return ArrayType.model_construct(element_type=items[0])
 
     def dict_type(self, items: list[Type]) -> DictType:
         """Transform dictionary type."""
-        return DictType(key_type=items[0], value_type=items[1])
+        return DictType.model_construct(key_type=items[0], value_type=items[1])
 
     def set_type(self, items: list[Type]) -> SetType:
         """Transform set type."""
-        return SetType(element_type=items[0])
+        return SetType.model_construct(element_type=items[0])
 
     def basic_type(self, items: list[Any]) -> Type:
         """Transform basic type."""
         item = items[0]
         if isinstance(item, Token) and item.type == "IDENTIFIER":
-            return TypeRef(name=item.value)
+            name = item.value
+            try:
+                return self._typerefs[name]
+            except KeyError:
+                typeref = self._typerefs[name] = TypeRef.model_construct(name=name)
+                return typeref
         return item
 
     def primitive_type(self, items: list[Token]) -> PrimitiveType:
         """Transform primitive type."""
-        token = items[0]
-        # Map token types to primitive names
-        type_map = {
-            "VOID": "void",
-            "BOOL": "bool",
-            "INT32": "int32_t",
-            "INT64": "int64_t",
-            "FLOAT": "float",
-            "DOUBLE": "double",
-        }
-        return PrimitiveType(name=type_map.get(token.type, token.value))
+        return _PRIM_CACHE[_PRIMITIVE_TOKEN_NAMES[items[0].type]]
 
     def string_type(self, items: list[Token]) -> PrimitiveType:
         """Transform string type."""
-        return PrimitiveType(name="string_t")
+        return _PRIM_CACHE["string_t"]
 
     # Expressions
-    def expression(self, items: list[Expression]) -> Expression:
-        """Transform expression."""
-        return items[0]
-
     def or_expr(self, items: list[Expression]) -> Expression:
         """Transform OR expression."""
-        if len(items) == 1:
-            return items[0]
-        result = items[0]
-        for i in range(1, len(items)):
-            result = BinaryExpression(operator="|", left=result, right=items[i])
-        return result
+        return _fold_implicit(items, "|")
 
     def and_expr(self, items: list[Expression]) -> Expression:
         """Transform AND expression."""
-        if len(items) == 1:
-            return items[0]
-        result = items[0]
-        for i in range(1, len(items)):
-            result = BinaryExpression(operator="&", left=result, right=items[i])
-        return result
+        return _fold_implicit(items, "&")
 
     def shift_expr(self, items: list[Any]) -> Expression:
         """Transform shift expression."""
-        if len(items) == 1:
-            return items[0]
-        if len(items) == 2:
-            # Handle case where we only have operator and right operand
-            if isinstance(items[0], Token):
-                return UnaryExpression(operator=items[0].value, operand=items[1])
-            else:
-                return items[0]
-        result = items[0]
-        i = 1
-        while i < len(items) - 1:
-            op = items[i].value if isinstance(items[i], Token) else items[i]
-            result = BinaryExpression(operator=op, left=result, right=items[i + 1])
-            i += 2
-        return result
+        return _left_fold(items)
 
     def add_expr(self, items: list[Any]) -> Expression:
         """Transform addition/subtraction expression."""
-        if len(items) == 1:
-            return items[0]
-        result = items[0]
-        i = 1
-        while i < len(items) - 1:
-            op = items[i].value if isinstance(items[i], Token) else items[i]
-            result = BinaryExpression(operator=op, left=result, right=items[i + 1])
-            i += 2
-        return result
+        return _left_fold(items)
 
     def mul_expr(self, items: list[Any]) -> Expression:
         """Transform multiplication/division expression."""
-        if len(items) == 1:
-            return items[0]
-        result = items[0]
-        i = 1
-        while i < len(items) - 1:
-            op = items[i].value if isinstance(items[i], Token) else items[i]
-            result = BinaryExpression(operator=op, left=result, right=items[i + 1])
-            i += 2
-        return result
+        return _left_fold(items)
 
     def unary_expr(self, items: list[Any]) -> Expression:
         """Transform unary expression."""
         if len(items) == 1:
             return items[0]
-        operator = items[0].value if isinstance(items[0], Token) else items[0]
-        return UnaryExpression(operator=operator, operand=items[1])
+        return UnaryExpression.model_construct(
+            operator=items[0].value, operand=items[1]
+        )
 
     def primary_expr(self, items: list[Any]) -> Expression:
         """Transform primary expression."""
@@ -366,27 +393,17 @@ class IDLTransformer(Transformer):
             return items[0]
         elif isinstance(items[0], Token):
             if items[0].type == "IDENTIFIER":
-                return IdentifierExpression(name=items[0].value)
+                return IdentifierExpression.model_construct(name=items[0].value)
         return items[0]
 
     def number(self, items: list[Token]) -> LiteralExpression:
         """Transform number literal."""
         token = items[0]
-        value_str = token.value
-        base = None
-
-        if token.type == "HEX_NUMBER":
-            value = int(value_str, 16)
-            base = "hex"
-        elif token.type == "BINARY_NUMBER":
-            value = int(value_str, 2)
-            base = "binary"
-        else:  # DECIMAL_NUMBER
-            value = int(value_str)
-
-        return LiteralExpression(value=value, base=base)
+        parse, base = _NUMBER_PARSE[token.type]
+        return LiteralExpression.model_construct(value=parse(token.value), base=base)
 
     # Handle identifiers - return the token itself for non-type contexts
     def IDENTIFIER(self, token: Token) -> Token:
-        """Return identifier token as-is."""
+        """Return identifier token with its value interned."""
+        token.value = sys.intern(token.value)
         return token
@@ -1,19 +1,26 @@
 """Semantic validation for AST nodes."""
 
-from typing import Any
+import sys
+from collections import Counter
+from typing import Any, Callable
 
 from loguru import logger
 
 from minimidl.ast.nodes import (
+    ArrayType,
     Constant,
+    DictType,
     Enum,
     ForwardDeclaration,
     IDLFile,
     Interface,
     Method,
     Namespace,
+    NullableType,
     Parameter,
+    PrimitiveType,
     Property,
+    SetType,
     Type,
     Typedef,
     TypeRef,
@@ -29,13 +36,48 @@ class ValidationError(Exception):
         self.node = node
 
 
+def _repeated_names(nodes: list[Any], names: list[str]) -> list[Any]:
+    """Return the nodes whose name repeats the name of an earlier node.
+
+    Args:
+        nodes: Named nodes, in declaration order.
+        names: The nodes' names, in the same order.
+
+    Returns:
+        Every node after the first with a given name, in declaration order.
+    """
+    counts = Counter(names)
+    if len(counts) == len(names):
+        return []
+
+    seen: set[str] = set()
+    repeated = []
+    for node, name in zip(nodes, names):
+        if counts[name] > 1:
+            if name in seen:
+                repeated.append(node)
+            seen.add(name)
+    return repeated
+
+
 class SemanticValidator:
     """Validate AST for semantic correctness."""
 
     def __init__(self) -> None:
         """Initialize validator."""
-        self.type_registry: dict[str, Any] = {}
+        # Namespace name -> {type name: kind}
+        self.type_registry: dict[str, dict[str, str]] = {}
         self.current_namespace: str | None = None
+        # Registry entry of the current namespace
+        self._namespace_types: dict[str, str] = {}
+        # Type node class -> validation handler (PrimitiveType is short-circuited)
+        self._type_dispatch: dict[type, Callable[[Any, str], None]] = {
+            TypeRef: self._validate_type_ref,
+            ArrayType: self._validate_array_type,
+            DictType: self._validate_dict_type,
+            SetType: self._validate_set_type,
+            NullableType: self._validate_nullable_type,
+        }
         self.errors: list[ValidationError] = []
 
     def validate(self, ast: IDLFile) -> None:
@@ -60,16 +102,17 @@ class SemanticValidator:
 
         if self.errors:
             # Report all errors
-            error_msg = "Semantic validation failed with {} error(s):\n".format(
+            header = "Semantic validation failed with {} error(s):\n".format(
                 len(self.errors)
             )
-            for error in self.errors:
-                error_msg += f"  - {error}\n"
+            error_msg = header + "".join(f"  - {error}\n" for error in self.errors)
             raise ValidationError(error_msg)
 
     def _register_namespace_types(self, namespace: Namespace) -> None:
         """Register all types defined in a namespace."""
-        self.current_namespace = namespace.name
+        namespace_name = sys.intern(namespace.name)
+        self.current_namespace = namespace_name
+        self._namespace_types = self.type_registry.setdefault(namespace_name, {})
 
         # Register forward declarations
         for forward in namespace.forward_declarations:
@@ -88,24 +131,28 @@ class SemanticValidator:
             self._register_type(typedef.name, "typedef")
 
     def _register_type(self, name: str, kind: str) -> None:
-        """Register a type in the registry."""
-        full_name = f"{self.current_namespace}::{name}"
-
-        if full_name in self.type_registry:
-            # Check if it's a forward declaration being defined
-            if self.type_registry[full_name] == "forward" and kind == "interface":
-                # This is OK - forward declaration being defined
-                self.type_registry[full_name] = kind
-                return
-
-            self.errors.append(ValidationError(f"Duplicate type definition: {name}"))
+        """Register a type in the current namespace's registry."""
+        # Interned keys let lookups of parsed (also interned) names hit on
+        # identity before falling back to comparing characters
+        name = sys.intern(name)
+        namespace_types = self._namespace_types
+        existing = namespace_types.get(name)
+
+        if existing is None:
+            namespace_types[name] = kind
+            logger.debug(
+                "Registered type: {}::{} ({})", self.current_namespace, name, kind
+            )
+        elif existing == "forward" and kind == "interface":
+            # This is OK - forward declaration being defined
+            namespace_types[name] = kind
         else:
-            self.type_registry[full_name] = kind
-            logger.debug(f"Registered type: {full_name} ({kind})")
+            self.errors.append(ValidationError(f"Duplicate type definition: {name}"))
 
     def _validate_namespace(self, namespace: Namespace) -> None:
         """Validate a namespace and its contents."""
         self.current_namespace = namespace.name
+        self._namespace_types = self.type_registry.get(namespace.name, {})
 
         # Validate all interfaces
         for interface in namespace.interfaces:
@@ -124,29 +171,37 @@ class SemanticValidator:
             self._validate_typedef(typedef)
 
     def _validate_interface(self, interface: Interface) -> None:
-        """Validate an interface."""
+        """Validate an interface.
+
+        Errors are reported member by member, in declaration order.
+        """
+        append_error = self.errors.append
+        validate_method = self._validate_method
+        validate_type = self._validate_type
+        interface_name = interface.name
+
         # Check for duplicate method names
-        method_names = set()
+        method_names: set[str] = set()
         for method in interface.methods:
             if method.name in method_names:
-                self.errors.append(
+                append_error(
                     ValidationError(
-                        f"Duplicate method name '{method.name}' in interface {interface.name}",
+                        f"Duplicate method name '{method.name}' in interface {interface_name}",
                         method,
                     )
                 )
             method_names.add(method.name)
 
             # Validate method
-            self._validate_method(method, interface.name)
+            validate_method(method, interface_name)
 
         # Check for duplicate property names
-        property_names = set()
+        property_names: set[str] = set()
         for prop in interface.properties:
             if prop.name in property_names:
-                self.errors.append(
+                append_error(
                     ValidationError(
-                        f"Duplicate property name '{prop.name}' in interface {interface.name}",
+                        f"Duplicate property name '{prop.name}' in interface {interface_name}",
                         prop,
                     )
                 )
@@ -154,95 +209,94 @@ class SemanticValidator:
 
             # Check for method/property name conflicts
             if prop.name in method_names:
-                self.errors.append(
+                append_error(
                     ValidationError(
-                        f"Property '{prop.name}' conflicts with method name in interface {interface.name}",
+                        f"Property '{prop.name}' conflicts with method name in interface {interface_name}",
                         prop,
                     )
                 )
 
             # Validate property type
-            self._validate_type(prop.type, f"property {prop.name}")
+            validate_type(prop.type, f"property {prop.name}")
 
     def _validate_method(self, method: Method, interface_name: str) -> None:
         """Validate a method."""
+        validate_type = self._validate_type
+        method_name = method.name
+
         # Validate return type
-        self._validate_type(method.return_type, f"return type of {method.name}")
+        validate_type(method.return_type, f"return type of {method_name}")
 
         # Validate parameters
-        param_names = set()
+        param_names: set[str] = set()
         for param in method.parameters:
             if param.name in param_names:
                 self.errors.append(
                     ValidationError(
-                        f"Duplicate parameter name '{param.name}' in method {interface_name}::{method.name}",
+                        f"Duplicate parameter name '{param.name}' in method {interface_name}::{method_name}",
                         param,
                     )
                 )
             param_names.add(param.name)
 
             # Validate parameter type
-            self._validate_type(
-                param.type, f"parameter '{param.name}' of {method.name}"
-            )
+            validate_type(param.type, f"parameter '{param.name}' of {method_name}")
 
     def _validate_type(self, type_spec: Type, context: str) -> None:
         """Validate a type reference."""
-        from minimidl.ast.nodes import (
-            ArrayType,
-            DictType,
-            NullableType,
-            PrimitiveType,
-            SetType,
-        )
-
-        if isinstance(type_spec, PrimitiveType):
-            # Primitive types are always valid (validated by Pydantic)
+        type_class = type(type_spec)
+        if type_class is PrimitiveType:
+            # Most common case; primitives are always valid (checked by Pydantic)
             return
-        elif isinstance(type_spec, TypeRef):
-            # Check if type exists
-            if not self._type_exists(type_spec.name):
-                self.errors.append(
-                    ValidationError(
-                        f"Unknown type '{type_spec.name}' in {context}", type_spec
-                    )
+
+        handler = self._type_dispatch.get(type_class)
+        if handler is not None:
+            handler(type_spec, context)
+
+    def _validate_type_ref(self, type_spec: TypeRef, context: str) -> None:
+        """Validate a reference to a user-defined type."""
+        # Check if type exists
+        if not self._type_exists(type_spec.name):
+            self.errors.append(
+                ValidationError(
+                    f"Unknown type '{type_spec.name}' in {context}",
+                    type_spec,
                 )
-        elif isinstance(type_spec, ArrayType):
-            self._validate_type(type_spec.element_type, f"array element in {context}")
-        elif isinstance(type_spec, DictType):
-            self._validate_type(type_spec.key_type, f"dict key in {context}")
-            self._validate_type(type_spec.value_type, f"dict value in {context}")
-        elif isinstance(type_spec, SetType):
-            self._validate_type(type_spec.element_type, f"set element in {context}")
-        elif isinstance(type_spec, NullableType):
-            self._validate_type(type_spec.inner_type, f"nullable type in {context}")
+            )
 
-    def _type_exists(self, name: str) -> bool:
-        """Check if a type exists in the registry."""
-        # Check with namespace prefix (types in same namespace)
-        full_name = f"{self.current_namespace}::{name}"
-        if full_name in self.type_registry:
-            return True
+    def _validate_array_type(self, type_spec: ArrayType, context: str) -> None:
+        """Validate an array type."""
+        self._validate_type(type_spec.element_type, f"array element in {context}")
+
+    def _validate_dict_type(self, type_spec: DictType, context: str) -> None:
+        """Validate a dict type."""
+        self._validate_type(type_spec.key_type, f"dict key in {context}")
+        self._validate_type(type_spec.value_type, f"dict value in {context}")
+
+    def _validate_set_type(self, type_spec: SetType, context: str) -> None:
+        """Validate a set type."""
+        self._validate_type(type_spec.element_type, f"set element in {context}")
 
-        # Check if it's "void" (special case for return types)
-        if name == "void":
-            return True
+    def _validate_nullable_type(self, type_spec: NullableType, context: str) -> None:
+        """Validate a nullable type."""
+        self._validate_type(type_spec.inner_type, f"nullable type in {context}")
 
-        return False
+    def _type_exists(self, name: str) -> bool:
+        """Check if a type exists in the registry."""
+        # Types in the same namespace, or "void" (special case for return types)
+        return name in self._namespace_types or name == "void"
 
     def _validate_enum(self, enum: Enum) -> None:
         """Validate an enum."""
         # Check for duplicate enum values
-        value_names = set()
-        for value in enum.values:
-            if value.name in value_names:
-                self.errors.append(
-                    ValidationError(
-                        f"Duplicate enum value '{value.name}' in enum {enum.name}",
-                        value,
-                    )
+        values = enum.values
+        for value in _repeated_names(values, [value.name for value in values]):
+            self.errors.append(
+                ValidationError(
+                    f"Duplicate enum value '{value.name}' in enum {enum.name}",
+                    value,
                 )
-            value_names.add(value.name)
+            )
 
         # Note: We don't validate enum value expressions here as they
         # should be evaluated during code generation
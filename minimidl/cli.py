@@ -1,7 +1,8 @@
 """MinimIDL command-line interface."""
 
-import json as json_lib
+import hashlib
 import sys
+from functools import cache
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -14,13 +15,7 @@ from minimidl import __version__
 from minimidl.ast.nodes import IDLFile
 from minimidl.ast.serialization import load_ast, save_ast
 from minimidl.ast.validator import SemanticValidator
-from minimidl.generators.c_wrapper import CWrapperGenerator
-from minimidl.generators.cpp import CppGenerator
-from minimidl.generators.swift import SwiftGenerator
 from minimidl.parser import IDLParser
-from minimidl.workflows.c_workflow import CWorkflow
-from minimidl.workflows.cpp_workflow import CppWorkflow
-from minimidl.workflows.swift_workflow import SwiftWorkflow
 
 app = typer.Typer(
     name="minimidl",
@@ -33,6 +28,21 @@ app = typer.Typer(
 console = Console()
 
 
+@cache
+def _get_parser() -> IDLParser:
+    """Return the IDL parser shared by all commands in this process."""
+    return IDLParser()
+
+
+@cache
+def _get_validator() -> SemanticValidator:
+    """Return the semantic validator shared by all commands in this process.
+
+    Reuse is safe because ``validate`` resets the validator's state.
+    """
+    return SemanticValidator()
+
+
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
@@ -83,14 +93,14 @@ def parse(
 
         # Read IDL file
         logger.debug(f"Reading IDL file: {idl_file}")
-        content = idl_file.read_text()
+        content = idl_file.read_text(encoding="utf-8")
 
         # Parse
-        parser = IDLParser()
+        parser = _get_parser()
         ast = parser.parse(content)
 
         # Validate
-        validator = SemanticValidator()
+        validator = _get_validator()
         errors = validator.validate(ast)
 
         if errors:
@@ -101,11 +111,13 @@ def parse(
 
         # Output
         if json:
-            json_data = ast.model_dump(mode="json", exclude_none=True)
-            json_str = json_lib.dumps(json_data, indent=2)
+            # Serialize directly in pydantic-core, without an intermediate dict
+            json_str = ast.model_dump_json(
+                indent=2, exclude_none=True, context={"tags": False}
+            )
             
             if output:
-                output.write_text(json_str)
+                output.write_text(json_str, encoding="utf-8")
                 console.print(f"[green]✓[/green] AST written to {output}")
             else:
                 console.print(json_str)
@@ -197,6 +209,9 @@ def generate(
             raise typer.Exit(1)
 
         # Load or parse AST
+        ast: IDLFile | None = None
+        ast_path: Path | None = None
+        cache_hit = False
         if from_ast:
             if not from_ast.exists():
                 console.print(f"[red]Error: AST file '{from_ast}' does not exist[/red]")
@@ -209,29 +224,40 @@ def generate(
                 console.print(f"[red]Error: IDL file '{idl_file}' does not exist[/red]")
                 raise typer.Exit(1)
             
-            # Parse IDL file
-            logger.info(f"Parsing {idl_file}")
-            content = idl_file.read_text()
-            parser = IDLParser()
-            ast = parser.parse(content)
+            source = idl_file.read_bytes()
+            source_hash = hashlib.blake2b(source).hexdigest()
 
-            # Cache AST if requested
+            # Reuse the cached AST if it was built from this exact source
             if cache_ast:
                 ast_path = ast_file or idl_file.with_suffix(".ast")
+                ast = _load_cached_ast(ast_path, source_hash)
+                cache_hit = ast is not None
+
+            if ast is None:
+                # Parse IDL file
+                logger.info(f"Parsing {idl_file}")
+                parser = _get_parser()
+                ast = parser.parse(source.decode("utf-8"))
+                ast.source_hash = source_hash
+
+        # A cached AST was validated before it was written
+        if not cache_hit:
+            # Validate
+            validator = _get_validator()
+            errors = validator.validate(ast)
+
+            if errors:
+                console.print("[red]Validation errors:[/red]")
+                for error in errors:
+                    console.print(f"  [yellow]•[/yellow] {error}")
+                raise typer.Exit(1)
+
+            # Cache AST if requested
+            if ast_path is not None:
                 logger.info(f"Caching AST to {ast_path}")
                 save_ast(ast, ast_path)
                 console.print(f"[green]✓[/green] AST cached to {ast_path}")
 
-        # Validate
-        validator = SemanticValidator()
-        errors = validator.validate(ast)
-
-        if errors:
-            console.print("[red]Validation errors:[/red]")
-            for error in errors:
-                console.print(f"  [yellow]•[/yellow] {error}")
-            raise typer.Exit(1)
-
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -254,20 +280,13 @@ def generate(
         total_files = 0
         
         with console.status("[bold green]Generating code...[/bold green]") as status:
+            # Targets run in order: project outputs overlap (the C and Swift
+            # projects share CWrapper/, the C++ and Swift ones README.md)
             for tgt in targets:
                 status.update(f"[bold green]Generating {tgt.upper()} code...[/bold green]")
-                
-                if project and tgt in ["cpp", "c", "swift"]:
-                    # Use workflow for complete project
-                    generated_files = _generate_with_workflow(
-                        ast, tgt, output_dir, config, template_dir
-                    )
-                else:
-                    # Use direct generator
-                    generated_files = _generate_direct(
-                        ast, tgt, output_dir, config, template_dir
-                    )
-                
+                generated_files = _generate_target(
+                    ast, tgt, output_dir, config, template_dir, project
+                )
                 total_files += len(generated_files)
                 console.print(f"[green]✓[/green] Generated {len(generated_files)} {tgt.upper()} files")
 
@@ -279,6 +298,49 @@ def generate(
         raise typer.Exit(1)
 
 
+def _load_cached_ast(ast_path: Path, source_hash: str) -> IDLFile | None:
+    """Load a cached AST if it exists and matches the IDL source hash.
+
+    Args:
+        ast_path: Path of the AST cache file.
+        source_hash: Hash of the current IDL source.
+
+    Returns:
+        The cached AST, or None if it is missing, unreadable or stale.
+    """
+    if not ast_path.exists():
+        return None
+
+    try:
+        ast = load_ast(ast_path)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable AST cache {ast_path}: {e}")
+        return None
+
+    if ast.source_hash != source_hash:
+        logger.debug(f"AST cache {ast_path} is stale")
+        return None
+
+    logger.debug(f"AST cache hit: {ast_path}")
+    return ast
+
+
+def _generate_target(
+    ast: IDLFile,
+    target: str,
+    output_dir: Path,
+    config: dict,
+    template_dir: Path | None,
+    project: bool,
+) -> list[Path]:
+    """Generate a single target as a project or with the direct generator."""
+    if project:
+        # Use workflow for complete project
+        return _generate_with_workflow(ast, target, output_dir, config, template_dir)
+    # Use direct generator
+    return _generate_direct(ast, target, output_dir, config, template_dir)
+
+
 def _generate_with_workflow(
     ast: IDLFile,
     target: str,
@@ -287,13 +349,21 @@ def _generate_with_workflow(
     template_dir: Path | None,
 ) -> list[Path]:
     """Generate using workflow for complete project."""
+    # Workflows pull in Jinja2 and are only needed here, so they are imported
+    # on use to keep the other commands fast to start
     if target == "cpp":
+        from minimidl.workflows.cpp_workflow import CppWorkflow
+
         workflow = CppWorkflow(config)
         return workflow.generate_project(ast, output_dir)
     elif target == "c":
+        from minimidl.workflows.c_workflow import CWorkflow
+
         workflow = CWorkflow(config)
         return workflow.generate_project(ast, output_dir)
     elif target == "swift":
+        from minimidl.workflows.swift_workflow import SwiftWorkflow
+
         workflow = SwiftWorkflow(config)
         return workflow.generate_project(ast, output_dir)
     else:
@@ -308,11 +378,18 @@ def _generate_direct(
     template_dir: Path | None,
 ) -> list[Path]:
     """Generate using direct generator."""
+    # Imported on use for the same reason as the workflows
     if target == "cpp":
+        from minimidl.generators.cpp import CppGenerator
+
         generator = CppGenerator(template_dir=template_dir)
     elif target == "c":
+        from minimidl.generators.c_wrapper import CWrapperGenerator
+
         generator = CWrapperGenerator(template_dir=template_dir)
     elif target == "swift":
+        from minimidl.generators.swift import SwiftGenerator
+
         generator = SwiftGenerator(template_dir=template_dir)
     else:
         raise ValueError(f"Unknown target: {target}")
@@ -333,12 +410,12 @@ def validate(
 
         # Read and parse
         logger.info(f"Validating {idl_file}")
-        content = idl_file.read_text()
-        parser = IDLParser()
+        content = idl_file.read_text(encoding="utf-8")
+        parser = _get_parser()
         ast = parser.parse(content)
 
         # Validate
-        validator = SemanticValidator()
+        validator = _get_validator()
         errors = validator.validate(ast)
 
         if errors:
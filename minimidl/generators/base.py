@@ -1,18 +1,187 @@
 """Base generator for code generation."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from importlib.resources import files
 from pathlib import Path
+from types import CodeType
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+)
+from jinja2.bccache import Bucket
 from loguru import logger
 
-from minimidl.ast.nodes import IDLFile
+from minimidl.ast.nodes import (
+    BinaryExpression,
+    Expression,
+    IdentifierExpression,
+    IDLFile,
+    LiteralExpression,
+    ParenthesizedExpression,
+    UnaryExpression,
+)
+
+
+@cache
+def _disk_bytecode_cache() -> BytecodeCache | None:
+    """Return the on-disk bytecode cache, or None if it cannot be used."""
+    try:
+        return FileSystemBytecodeCache(pattern="__minimidl_%s.cache")
+    except (OSError, RuntimeError) as e:
+        logger.debug("Template bytecode cache disabled: {}", e)
+        return None
+
+
+class _MemoryBytecodeCache(BytecodeCache):
+    """Process-wide cache of compiled template code.
+
+    Environments cannot be shared between generators because their filters are
+    bound to generator instance state, but the compiled code of a template is
+    environment-independent. Sharing it means each template source is parsed
+    and compiled once per process, however many generators load it.
+
+    Misses fall through to an on-disk cache in the user's temp directory, so a
+    fresh CLI process loads the compiled code instead of recompiling every
+    template it renders.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._codes: dict[str, tuple[str, CodeType]] = {}
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Fill the bucket with cached code if the source is unchanged."""
+        entry = self._codes.get(bucket.key)
+        if entry is not None and entry[0] == bucket.checksum:
+            bucket.code = entry[1]
+            return
+
+        disk = _disk_bytecode_cache()
+        if disk is not None:
+            disk.load_bytecode(bucket)
+            if bucket.code is not None:
+                self._codes[bucket.key] = (bucket.checksum, bucket.code)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Remember the freshly compiled code of the bucket."""
+        if bucket.code is None:
+            return
+        self._codes[bucket.key] = (bucket.checksum, bucket.code)
+
+        disk = _disk_bytecode_cache()
+        if disk is not None:
+            try:
+                disk.dump_bytecode(bucket)
+            except OSError as e:
+                # The disk layer is only an optimization
+                logger.debug("Could not persist template bytecode: {}", e)
+
+    def clear(self) -> None:
+        """Drop all cached code."""
+        self._codes.clear()
+
+
+_BYTECODE_CACHE = _MemoryBytecodeCache()
+
+# Expression node class -> names of its operand fields, in rendering order.
+# Classes not listed here are leaves.
+EXPRESSION_OPERAND_FIELDS: dict[type, tuple[str, ...]] = {
+    UnaryExpression: ("operand",),
+    BinaryExpression: ("left", "right"),
+    ParenthesizedExpression: ("expression",),
+}
+
+
+def strip_i_prefix(name: str) -> str:
+    """Drop the conventional leading "I" from an interface name."""
+    return name[1:] if name.startswith("I") else name
+
+
+# Upper bound on threads used to write generated files
+_MAX_WRITE_WORKERS = 8
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write generated content to a file unless it already holds it.
+
+    Leaving unchanged files untouched keeps their modification times, so
+    regenerating does not trigger rebuilds of code that did not change.
+
+    Args:
+        path: Output file path
+        content: File content
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = content.encode("utf-8")
+    try:
+        # Comparing sizes first avoids reading files that obviously differ
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            logger.debug(f"Unchanged {path}")
+            return False
+    except FileNotFoundError:
+        pass
+
+    logger.info(f"Writing {path}")
+    path.write_bytes(data)
+    return True
+
+
+def write_files(files: list[tuple[Path, str]]) -> list[Path]:
+    """Write several generated files concurrently.
+
+    File writes are I/O-bound, so they are spread over a small thread pool.
+    Files whose content is unchanged are not rewritten.
+    If the same path is listed more than once, only its last content is
+    written, which leaves the same result as writing the files in order.
+
+    Args:
+        files: (output path, content) pairs, in generation order
+
+    Returns:
+        The output paths, in the order given
+    """
+    latest = dict(files)
+
+    # Create directories up front so worker threads only write
+    for directory in {path.parent for path in latest}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    if len(latest) <= 1:
+        for path, content in latest.items():
+            write_if_changed(path, content)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_WRITE_WORKERS, len(latest))
+        ) as executor:
+            # list() surfaces the first write error, if any
+            list(executor.map(write_if_changed, latest.keys(), latest.values()))
+
+    return [path for path, _ in files]
+
+
+@cache
+def _package_template_dir() -> str:
+    """Return the directory of the templates embedded in the package."""
+    return str(files("minimidl.generators.templates"))
 
 
 class BaseGenerator(ABC):
     """Base class for all code generators."""
 
+    # Literal base -> formatter used by render_expression; literals without a
+    # formatter (decimal ones) use str()
+    _literal_formats: dict[str, Callable[[int], str]] = {}
+
     def __init__(self, template_dir: Path | None = None) -> None:
         """Initialize the generator.
 
@@ -22,27 +191,32 @@ class BaseGenerator(ABC):
         """
         self.template_dir = template_dir
         self._env: Environment | None = None
+        self._template_cache: dict[str, Template] = {}
+        # Expression node class -> rendering handler
+        self._expr_dispatch: dict[type, Callable[..., str]] = {
+            LiteralExpression: self._render_literal,
+            IdentifierExpression: self._render_identifier,
+            UnaryExpression: self._render_unary,
+            BinaryExpression: self._render_binary,
+            ParenthesizedExpression: self._render_parenthesized,
+        }
 
     @property
     def jinja_env(self) -> Environment:
         """Get or create Jinja2 environment."""
         if self._env is None:
-            if self.template_dir:
-                self._env = Environment(
-                    loader=FileSystemLoader(self.template_dir),
-                    trim_blocks=True,
-                    lstrip_blocks=True,
-                )
-            else:
-                # Use templates embedded in package
-                from importlib.resources import files
-
-                templates = files("minimidl.generators.templates")
-                self._env = Environment(
-                    loader=FileSystemLoader(str(templates)),
-                    trim_blocks=True,
-                    lstrip_blocks=True,
-                )
+            # Use templates embedded in package unless a directory was given
+            template_dir = self.template_dir or _package_template_dir()
+            self._env = Environment(
+                loader=FileSystemLoader(template_dir),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                # Templates don't change while a generator is alive
+                auto_reload=False,
+                # Never evict loaded templates; there are only a few dozen
+                cache_size=-1,
+                bytecode_cache=_BYTECODE_CACHE,
+            )
 
             # Add custom filters
             self._env.filters.update(self.get_custom_filters())
@@ -58,7 +232,12 @@ class BaseGenerator(ABC):
         Returns:
             Jinja2 template
         """
-        return self.jinja_env.get_template(name)
+        # Skips Jinja's per-call name resolution and up-to-date check
+        template = self._template_cache.get(name)
+        if template is None:
+            template = self.jinja_env.get_template(name)
+            self._template_cache[name] = template
+        return template
 
     def get_custom_filters(self) -> dict[str, Any]:
         """Get custom Jinja2 filters for this generator.
@@ -68,6 +247,67 @@ class BaseGenerator(ABC):
         """
         return {}
 
+    def render_expression(self, expr: Expression) -> str:
+        """Render an expression to code in the target language.
+
+        Args:
+            expr: Expression AST node
+
+        Returns:
+            Expression string
+        """
+        dispatch = self._expr_dispatch
+
+        # Post-order walk with an explicit stack instead of recursion: an
+        # operator node is popped once to queue its operands, and again to
+        # combine their rendered strings
+        rendered: list[str] = []
+        stack: list[tuple[Any, bool]] = [(expr, False)]
+        while stack:
+            node, operands_done = stack.pop()
+            handler = dispatch.get(type(node))
+            if handler is None:
+                # Fallback for direct values (from transformer)
+                rendered.append(str(node))
+                continue
+
+            fields = EXPRESSION_OPERAND_FIELDS.get(type(node))
+            if fields is None:
+                rendered.append(handler(node))
+            elif operands_done:
+                operands = rendered[-len(fields) :]
+                del rendered[-len(fields) :]
+                rendered.append(handler(node, *operands))
+            else:
+                stack.append((node, True))
+                for field in reversed(fields):
+                    stack.append((getattr(node, field), False))
+
+        return rendered[0]
+
+    def _render_literal(self, expr: LiteralExpression) -> str:
+        """Render a literal in the notation given by ``_literal_formats``."""
+        formatter = self._literal_formats.get(expr.base)
+        if formatter is not None:
+            return formatter(expr.value)
+        return str(expr.value)
+
+    def _render_identifier(self, expr: IdentifierExpression) -> str:
+        """Render an identifier reference."""
+        return expr.name
+
+    def _render_unary(self, expr: UnaryExpression, operand: str) -> str:
+        """Render a unary operation around its rendered operand."""
+        return f"{expr.operator}{operand}"
+
+    def _render_binary(self, expr: BinaryExpression, left: str, right: str) -> str:
+        """Render a binary operation, always parenthesized."""
+        return f"({left} {expr.operator} {right})"
+
+    def _render_parenthesized(self, expr: ParenthesizedExpression, inner: str) -> str:
+        """Render a parenthesized expression around its rendered contents."""
+        return f"({inner})"
+
     @abstractmethod
     def generate(self, idl_file: IDLFile, output_dir: Path) -> list[Path]:
         """Generate code from AST.
@@ -106,8 +346,17 @@ class BaseGenerator(ABC):
         """
         output_path = output_dir / filename
         output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        logger.info(f"Writing {output_path}")
-        output_path.write_text(content)
+        write_if_changed(output_path, content)
 
         return output_path
+
+    def write_files(self, files: list[tuple[Path, str]]) -> list[Path]:
+        """Write several generated files concurrently.
+
+        Args:
+            files: (output path, content) pairs, in generation order
+
+        Returns:
+            The output paths, in the order given
+        """
+        return write_files(files)
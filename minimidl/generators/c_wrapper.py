@@ -1,41 +1,81 @@
 """C wrapper generator for MinimIDL."""
 
+import sys
+from collections.abc import Set as AbstractSet
 from pathlib import Path
 from typing import Any
 
 from minimidl.ast.nodes import (
     ArrayType,
-    BinaryExpression,
     DictType,
-    Enum,
-    Expression,
-    IdentifierExpression,
     IDLFile,
-    Interface,
-    LiteralExpression,
-    Method,
     Namespace,
     NullableType,
-    Parameter,
-    ParenthesizedExpression,
     PrimitiveType,
-    Property,
     SetType,
     Type,
     TypeRef,
-    UnaryExpression,
 )
 from minimidl.generators.base import BaseGenerator
 
+# IDL primitive type name -> C type
+_C_PRIMITIVE_TYPES = {
+    "void": "void",
+    "bool": "bool",
+    "int32_t": "int32_t",
+    "int64_t": "int64_t",
+    "float": "float",
+    "double": "double",
+    "string_t": "IDynamicString_Handle",
+}
+
+# Literal base -> formatter; C doesn't support binary literals, so they are
+# written in hex
+_C_LITERAL_FORMATS = {
+    "hex": "0x{:X}".format,
+    "binary": "0x{:X}".format,
+}
+
 
 class CWrapperGenerator(BaseGenerator):
     """Generate C wrapper code from MinimIDL AST."""
 
+    _literal_formats = _C_LITERAL_FORMATS
+
     def __init__(self, template_dir: Path | None = None) -> None:
         """Initialize the C wrapper generator."""
         super().__init__(template_dir)
+        # id(type node) -> (type node, C type); keeping the node in the entry
+        # stops its id from being reused while the entry exists
+        self._c_type_cache: dict[int, tuple[Type, str]] = {}
+        # Interface name -> handle type name
+        self._handle_types: dict[str, str] = {}
+        # (interface, member, prefix) -> C function name
+        self._function_names: dict[tuple[str, str, str], str] = {}
         self.namespace_prefix = ""
-        self.enum_names: set[str] = set()
+        self.enum_names = set()
+
+    @property
+    def namespace_prefix(self) -> str:
+        """Prefix of the collection handle types of the current namespace."""
+        return self._namespace_prefix
+
+    @namespace_prefix.setter
+    def namespace_prefix(self, value: str) -> None:
+        # Cached C types depend on the prefix
+        self._namespace_prefix = value
+        self._c_type_cache.clear()
+
+    @property
+    def enum_names(self) -> AbstractSet[str]:
+        """Names of the enums of the current namespace."""
+        return self._enum_names
+
+    @enum_names.setter
+    def enum_names(self, value: AbstractSet[str]) -> None:
+        # Cached C types depend on which references are enums
+        self._enum_names = value
+        self._c_type_cache.clear()
 
     def get_custom_filters(self) -> dict[str, Any]:
         """Get C wrapper specific Jinja2 filters."""
@@ -69,44 +109,44 @@ class CWrapperGenerator(BaseGenerator):
         Returns:
             C type string
         """
-        if isinstance(type_spec, PrimitiveType):
-            type_map = {
-                "void": "void",
-                "bool": "bool",
-                "int32_t": "int32_t",
-                "int64_t": "int64_t",
-                "float": "float",
-                "double": "double",
-                "string_t": "IDynamicString_Handle",
-            }
-            return type_map.get(type_spec.name, type_spec.name)
-
-        elif isinstance(type_spec, TypeRef):
+        entry = self._c_type_cache.get(id(type_spec))
+        if entry is not None and entry[0] is type_spec:
+            return entry[1]
+
+        result = self._map_c_type(type_spec)
+        self._c_type_cache[id(type_spec)] = (type_spec, result)
+        return result
+
+    def _map_c_type(self, type_spec: Type) -> str:
+        """Compute the C type of an IDL type, without caching."""
+        # Nullable types are the same as non-nullable in C
+        # NULL represents the null value
+        type_spec = self._unwrap(type_spec)
+        type_class = type_spec.__class__
+        if type_class is PrimitiveType:
+            return _C_PRIMITIVE_TYPES.get(type_spec.name, type_spec.name)
+
+        elif type_class is TypeRef:
             # Check if it's an enum or interface
             if type_spec.name in self.enum_names:
                 # Enums are just typedefs
                 return type_spec.name
             else:
                 # For interfaces, we use handles
-                return f"{type_spec.name}_Handle"
+                return self.c_handle_type(type_spec.name)
 
-        elif isinstance(type_spec, ArrayType):
+        elif type_class is ArrayType:
             # Arrays need special handling - return handle
             return f"{self.namespace_prefix}Array_Handle"
 
-        elif isinstance(type_spec, DictType):
+        elif type_class is DictType:
             # Dicts need special handling - return handle
             return f"{self.namespace_prefix}Dict_Handle"
 
-        elif isinstance(type_spec, SetType):
+        elif type_class is SetType:
             # Sets need special handling - return handle
             return f"{self.namespace_prefix}Set_Handle"
 
-        elif isinstance(type_spec, NullableType):
-            # Nullable types are the same as non-nullable in C
-            # NULL represents the null value
-            return self.c_type(type_spec.inner_type)
-
         return "void*"
 
     def c_param_type(self, type_spec: Type) -> str:
@@ -142,7 +182,12 @@ class CWrapperGenerator(BaseGenerator):
         Returns:
             C handle type name
         """
-        return f"{interface_name}_Handle"
+        handle_type = self._handle_types.get(interface_name)
+        if handle_type is None:
+            # Interned so every use of a handle type shares one string
+            handle_type = sys.intern(f"{interface_name}_Handle")
+            self._handle_types[interface_name] = handle_type
+        return handle_type
 
     def c_function_name(
         self, interface_name: str, member_name: str, prefix: str = ""
@@ -157,70 +202,67 @@ class CWrapperGenerator(BaseGenerator):
         Returns:
             C function name
         """
-        if prefix:
-            return f"{interface_name}_{prefix}{member_name}"
-        return f"{interface_name}_{member_name}"
+        key = (interface_name, member_name, prefix)
+        function_name = self._function_names.get(key)
+        if function_name is None:
+            function_name = sys.intern(f"{interface_name}_{prefix}{member_name}")
+            self._function_names[key] = function_name
+        return function_name
 
     def needs_array_interface(self, type_spec: Type) -> bool:
         """Check if type needs array iteration interface."""
-        return isinstance(type_spec, ArrayType)
+        return type_spec.__class__ is ArrayType
 
     def needs_dict_interface(self, type_spec: Type) -> bool:
         """Check if type needs dictionary iteration interface."""
-        return isinstance(type_spec, DictType)
+        return type_spec.__class__ is DictType
 
     def needs_set_interface(self, type_spec: Type) -> bool:
         """Check if type needs set iteration interface."""
-        return isinstance(type_spec, SetType)
+        return type_spec.__class__ is SetType
 
     def is_nullable(self, type_spec: Type) -> bool:
         """Check if type is nullable."""
-        return isinstance(type_spec, NullableType)
+        return type_spec.__class__ is NullableType
+
+    @staticmethod
+    def _unwrap(type_spec: Type) -> Type:
+        """Return the type inside any nullable wrappers."""
+        while type_spec.__class__ is NullableType:
+            type_spec = type_spec.inner_type
+        return type_spec
 
     def is_primitive(self, type_spec: Type) -> bool:
         """Check if type is primitive."""
-        if isinstance(type_spec, NullableType):
-            return self.is_primitive(type_spec.inner_type)
-        return isinstance(type_spec, PrimitiveType) and type_spec.name != "string_t"
+        type_spec = self._unwrap(type_spec)
+        return type_spec.__class__ is PrimitiveType and type_spec.name != "string_t"
 
     def is_string(self, type_spec: Type) -> bool:
         """Check if type is string."""
-        if isinstance(type_spec, NullableType):
-            return self.is_string(type_spec.inner_type)
-        return isinstance(type_spec, PrimitiveType) and type_spec.name == "string_t"
+        type_spec = self._unwrap(type_spec)
+        return type_spec.__class__ is PrimitiveType and type_spec.name == "string_t"
 
     def is_array(self, type_spec: Type) -> bool:
         """Check if type is array."""
-        if isinstance(type_spec, NullableType):
-            return self.is_array(type_spec.inner_type)
-        return isinstance(type_spec, ArrayType)
+        return self._unwrap(type_spec).__class__ is ArrayType
 
     def is_dict(self, type_spec: Type) -> bool:
         """Check if type is dictionary."""
-        if isinstance(type_spec, NullableType):
-            return self.is_dict(type_spec.inner_type)
-        return isinstance(type_spec, DictType)
+        return self._unwrap(type_spec).__class__ is DictType
 
     def is_set(self, type_spec: Type) -> bool:
         """Check if type is set."""
-        if isinstance(type_spec, NullableType):
-            return self.is_set(type_spec.inner_type)
-        return isinstance(type_spec, SetType)
-    
+        return self._unwrap(type_spec).__class__ is SetType
+
     def is_enum(self, type_spec: Type) -> bool:
         """Check if type is an enum."""
-        if isinstance(type_spec, NullableType):
-            return self.is_enum(type_spec.inner_type)
-        if isinstance(type_spec, TypeRef):
-            # Check if this type name is in our enum names set
-            return type_spec.name in self.enum_names
-        return False
+        type_spec = self._unwrap(type_spec)
+        # Check if this type name is in our enum names set
+        return type_spec.__class__ is TypeRef and type_spec.name in self.enum_names
 
     def is_interface(self, type_spec: Type) -> bool:
         """Check if type is an interface reference."""
-        if isinstance(type_spec, NullableType):
-            return self.is_interface(type_spec.inner_type)
-        return isinstance(type_spec, TypeRef)
+        return self._unwrap(type_spec).__class__ is TypeRef
 
     def export_macro(self, namespace: Namespace | str) -> str:
         """Get export macro name for namespace."""
@@ -228,43 +270,6 @@ class CWrapperGenerator(BaseGenerator):
             return f"{namespace.name.upper()}_API"
         return f"{namespace.upper()}_API"
 
-    def render_expression(self, expr: Expression) -> str:
-        """Render an expression to C code.
-
-        Args:
-            expr: Expression AST node
-
-        Returns:
-            C expression string
-        """
-        if isinstance(expr, LiteralExpression):
-            if expr.base == "hex":
-                return f"0x{expr.value:X}"
-            elif expr.base == "binary":
-                # C doesn't support binary literals, convert to hex
-                return f"0x{expr.value:X}"
-            else:
-                return str(expr.value)
-
-        elif isinstance(expr, IdentifierExpression):
-            return expr.name
-
-        elif isinstance(expr, UnaryExpression):
-            operand = self.render_expression(expr.operand)
-            return f"{expr.operator}{operand}"
-
-        elif isinstance(expr, BinaryExpression):
-            left = self.render_expression(expr.left)
-            right = self.render_expression(expr.right)
-            return f"({left} {expr.operator} {right})"
-
-        elif isinstance(expr, ParenthesizedExpression):
-            inner = self.render_expression(expr.expression)
-            return f"({inner})"
-
-        # Fallback for direct values (from transformer)
-        return str(expr)
-
     def generate(self, idl_file: IDLFile, output_dir: Path) -> list[Path]:
         """Generate C wrapper code from AST.
 
@@ -275,54 +280,45 @@ class CWrapperGenerator(BaseGenerator):
         Returns:
             List of generated file paths
         """
-        generated_files = []
+        files: list[tuple[Path, str]] = []
+
+        # Load templates once for all namespaces
+        header_template = self.get_template("c_wrapper/wrapper.h.j2")
+        impl_template = self.get_template("c_wrapper/wrapper.cpp.j2")
+        exports_template = self.get_template("c_wrapper/exports.def.j2")
+        cmake_template = self.get_template("c_wrapper/CMakeLists.txt.j2")
+        testbed_template = self.get_template("c_wrapper/testbed.c.j2")
 
-        # For each namespace, generate wrapper files
+        # For each namespace, render wrapper files
         for namespace in idl_file.namespaces:
             self.namespace_prefix = namespace.name
+            ns_lower = namespace.name.lower()
 
             # Collect enum names for type resolution
-            self.enum_names = {enum.name for enum in namespace.enums}
+            self.enum_names = frozenset(enum.name for enum in namespace.enums)
 
             # Generate wrapper header
-            header_template = self.get_template("c_wrapper/wrapper.h.j2")
             header_content = header_template.render(namespace=namespace)
-            header_path = self.write_file(
-                output_dir, f"{namespace.name.lower()}_wrapper.h", header_content
-            )
-            generated_files.append(header_path)
+            files.append((output_dir / f"{ns_lower}_wrapper.h", header_content))
 
             # Generate wrapper implementation
-            impl_template = self.get_template("c_wrapper/wrapper.cpp.j2")
             impl_content = impl_template.render(namespace=namespace)
-            impl_path = self.write_file(
-                output_dir, f"{namespace.name.lower()}_wrapper.cpp", impl_content
-            )
-            generated_files.append(impl_path)
+            files.append((output_dir / f"{ns_lower}_wrapper.cpp", impl_content))
 
             # Generate Windows exports file
-            exports_template = self.get_template("c_wrapper/exports.def.j2")
             exports_content = exports_template.render(namespace=namespace)
-            exports_path = self.write_file(
-                output_dir, f"{namespace.name.lower()}_exports.def", exports_content
-            )
-            generated_files.append(exports_path)
+            files.append((output_dir / f"{ns_lower}_exports.def", exports_content))
 
             # Generate CMakeLists.txt
-            cmake_template = self.get_template("c_wrapper/CMakeLists.txt.j2")
             cmake_content = cmake_template.render(namespace=namespace)
-            cmake_path = self.write_file(output_dir, "CMakeLists.txt", cmake_content)
-            generated_files.append(cmake_path)
+            files.append((output_dir / "CMakeLists.txt", cmake_content))
 
             # Generate test harness
-            testbed_template = self.get_template("c_wrapper/testbed.c.j2")
             testbed_content = testbed_template.render(namespace=namespace)
-            testbed_path = self.write_file(
-                output_dir, f"{namespace.name.lower()}_test.c", testbed_content
-            )
-            generated_files.append(testbed_path)
+            files.append((output_dir / f"{ns_lower}_test.c", testbed_content))
 
-        return generated_files
+        # Write all rendered files
+        return self.write_files(files)
 
     def get_output_filename(self, namespace_name: str) -> str:
         """Get output filename for a namespace.
@@ -5,26 +5,46 @@ from typing import Any
 
 from minimidl.ast.nodes import (
     ArrayType,
-    BinaryExpression,
     DictType,
-    Expression,
-    IdentifierExpression,
     IDLFile,
-    LiteralExpression,
     NullableType,
-    ParenthesizedExpression,
     PrimitiveType,
     SetType,
     Type,
     TypeRef,
-    UnaryExpression,
 )
 from minimidl.generators.base import BaseGenerator
 
+# IDL primitive type name -> C++ type
+_CPP_PRIMITIVE_TYPES = {
+    "void": "void",
+    "bool": "bool",
+    "int32_t": "int32_t",
+    "int64_t": "int64_t",
+    "float": "float",
+    "double": "double",
+    "string_t": "std::string",
+}
+
+# Literal base -> formatter; decimal literals use str()
+_CPP_LITERAL_FORMATS = {
+    "hex": "0x{:X}".format,
+    "binary": "0b{:b}".format,
+}
+
 
 class CppGenerator(BaseGenerator):
     """Generate C++ code from MinimIDL AST."""
 
+    _literal_formats = _CPP_LITERAL_FORMATS
+
+    def __init__(self, template_dir: Path | None = None) -> None:
+        """Initialize the C++ generator."""
+        super().__init__(template_dir)
+        # id(type node) -> (type node, C++ type); keeping the node in the entry
+        # stops its id from being reused while the entry exists
+        self._cpp_type_cache: dict[int, tuple[Type, str]] = {}
+
     def get_custom_filters(self) -> dict[str, Any]:
         """Get C++ specific Jinja2 filters."""
         return {
@@ -42,39 +62,41 @@ class CppGenerator(BaseGenerator):
         Returns:
             C++ type string
         """
-        if isinstance(type_spec, PrimitiveType):
-            type_map = {
-                "void": "void",
-                "bool": "bool",
-                "int32_t": "int32_t",
-                "int64_t": "int64_t",
-                "float": "float",
-                "double": "double",
-                "string_t": "std::string",
-            }
-            return type_map.get(type_spec.name, type_spec.name)
-
-        elif isinstance(type_spec, TypeRef):
+        entry = self._cpp_type_cache.get(id(type_spec))
+        if entry is not None and entry[0] is type_spec:
+            return entry[1]
+
+        result = self._map_cpp_type(type_spec)
+        self._cpp_type_cache[id(type_spec)] = (type_spec, result)
+        return result
+
+    def _map_cpp_type(self, type_spec: Type) -> str:
+        """Compute the C++ type of an IDL type, without caching."""
+        type_class = type_spec.__class__
+        if type_class is PrimitiveType:
+            return _CPP_PRIMITIVE_TYPES.get(type_spec.name, type_spec.name)
+
+        elif type_class is TypeRef:
             # Could be enum or interface reference
             return type_spec.name
 
-        elif isinstance(type_spec, ArrayType):
+        elif type_class is ArrayType:
             element_type = self.cpp_type(type_spec.element_type)
             return f"std::vector<{element_type}>"
 
-        elif isinstance(type_spec, DictType):
+        elif type_class is DictType:
             key_type = self.cpp_type(type_spec.key_type)
             value_type = self.cpp_type(type_spec.value_type)
             return f"std::unordered_map<{key_type}, {value_type}>"
 
-        elif isinstance(type_spec, SetType):
+        elif type_class is SetType:
             element_type = self.cpp_type(type_spec.element_type)
             return f"std::unordered_set<{element_type}>"
 
-        elif isinstance(type_spec, NullableType):
+        elif type_class is NullableType:
             inner_type = self.cpp_type(type_spec.inner_type)
             # For primitives, use std::optional
-            if isinstance(type_spec.inner_type, PrimitiveType):
+            if type_spec.inner_type.__class__ is PrimitiveType:
                 return f"std::optional<{inner_type}>"
             # For objects, use shared_ptr
             else:
@@ -94,48 +116,12 @@ class CppGenerator(BaseGenerator):
         cpp_type = self.cpp_type(type_spec)
 
         # Primitives are passed by value
-        if isinstance(type_spec, PrimitiveType) and type_spec.name != "string_t":
+        if type_spec.__class__ is PrimitiveType and type_spec.name != "string_t":
             return cpp_type
 
         # Everything else by const reference
         return f"const {cpp_type}&"
 
-    def render_expression(self, expr: Expression) -> str:
-        """Render an expression to C++ code.
-
-        Args:
-            expr: Expression AST node
-
-        Returns:
-            C++ expression string
-        """
-        if isinstance(expr, LiteralExpression):
-            if expr.base == "hex":
-                return f"0x{expr.value:X}"
-            elif expr.base == "binary":
-                return f"0b{expr.value:b}"
-            else:
-                return str(expr.value)
-
-        elif isinstance(expr, IdentifierExpression):
-            return expr.name
-
-        elif isinstance(expr, UnaryExpression):
-            operand = self.render_expression(expr.operand)
-            return f"{expr.operator}{operand}"
-
-        elif isinstance(expr, BinaryExpression):
-            left = self.render_expression(expr.left)
-            right = self.render_expression(expr.right)
-            return f"({left} {expr.operator} {right})"
-
-        elif isinstance(expr, ParenthesizedExpression):
-            inner = self.render_expression(expr.expression)
-            return f"({inner})"
-
-        # Fallback for direct values (from transformer)
-        return str(expr)
-
     def generate(self, idl_file: IDLFile, output_dir: Path) -> list[Path]:
         """Generate C++ code from AST.
 
@@ -146,7 +132,10 @@ class CppGenerator(BaseGenerator):
         Returns:
             List of generated file paths
         """
-        generated_files = []
+        files: list[tuple[Path, str]] = []
+
+        # Cached types only need to live as long as the AST being generated
+        self._cpp_type_cache.clear()
 
         # Group namespaces by output file
         # For now, generate one file per namespace
@@ -156,12 +145,10 @@ class CppGenerator(BaseGenerator):
             # Render template
             template = self.get_template("cpp/interface.hpp.jinja2")
             content = template.render(namespaces=[namespace])
+            files.append((output_dir / filename, content))
 
-            # Write file
-            output_path = self.write_file(output_dir, filename, content)
-            generated_files.append(output_path)
-
-        return generated_files
+        # Write files
+        return self.write_files(files)
 
     def get_output_filename(self, namespace_name: str) -> str:
         """Get output filename for a namespace.
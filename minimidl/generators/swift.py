@@ -1,44 +1,129 @@
 """Swift binding generator for MinimIDL."""
 
+from collections.abc import Callable
+from collections.abc import Set as AbstractSet
+from functools import wraps
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from minimidl.ast.nodes import (
     ArrayType,
-    BinaryExpression,
     DictType,
     Enum,
     Expression,
-    IdentifierExpression,
     IDLFile,
     Interface,
-    LiteralExpression,
     Method,
     Namespace,
     NullableType,
     Parameter,
-    ParenthesizedExpression,
     PrimitiveType,
     Property,
     SetType,
     Type,
     TypeRef,
-    UnaryExpression,
 )
 from minimidl.generators.base import BaseGenerator
 from minimidl.generators.c_wrapper import CWrapperGenerator
 
+# IDL primitive type name -> Swift type
+_SWIFT_PRIMITIVE_TYPES = {
+    "void": "Void",
+    "bool": "Bool",
+    "int32_t": "Int32",
+    "int64_t": "Int64",
+    "float": "Float",
+    "double": "Double",
+    "string_t": "String",
+}
+
+# Literal base -> formatter; decimal literals use str()
+_SWIFT_LITERAL_FORMATS = {
+    "hex": "0x{:X}".format,
+    "binary": "0b{:b}".format,
+}
+
+_Result = TypeVar("_Result")
+
+
+def _capitalize_first(text: str) -> str:
+    """Upper-case the first character, leaving the rest untouched."""
+    return text[0].upper() + text[1:] if text else ""
+
+
+def _memoize_on_node(
+    method: Callable[[Any, Any], _Result],
+) -> Callable[[Any, Any], _Result]:
+    """Cache a filter's result per AST node.
+
+    Results live in the generator's ``_type_filter_cache``, keyed by filter
+    name and ``id()`` of the node. Each entry keeps the node itself, so a hit
+    requires the very same object and its id cannot be reused meanwhile.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: Any, type_spec: Any) -> _Result:
+        cache = self._type_filter_cache
+        key = (name, id(type_spec))
+        entry = cache.get(key)
+        if entry is not None and entry[0] is type_spec:
+            return entry[1]
+        result = method(self, type_spec)
+        cache[key] = (type_spec, result)
+        return result
+
+    return wrapper
+
 
 class SwiftGenerator(BaseGenerator):
     """Generate Swift bindings from MinimIDL AST."""
 
-    def __init__(self, template_dir: Path | None = None) -> None:
-        """Initialize the Swift generator."""
+    _literal_formats = _SWIFT_LITERAL_FORMATS
+
+    def __init__(
+        self,
+        template_dir: Path | None = None,
+        c_gen: CWrapperGenerator | None = None,
+    ) -> None:
+        """Initialize the Swift generator.
+
+        Args:
+            template_dir: Directory containing Jinja2 templates.
+                         If None, will use default templates.
+            c_gen: C wrapper generator to take C function names from.
+                   If None, a private one is created.
+        """
         super().__init__(template_dir)
         # We'll use the C wrapper generator for C function names
-        self.c_gen = CWrapperGenerator()
+        self.c_gen = c_gen if c_gen is not None else CWrapperGenerator()
         self.namespace_name = ""
-        self.enum_names: set[str] = set()
+        # Type node class -> Swift type mapper; plain strings are type names
+        self._swift_type_dispatch: dict[type, Callable[[Any], str]] = {
+            str: self._swift_type_name,
+            PrimitiveType: self._swift_primitive,
+            TypeRef: self._swift_type_ref,
+            ArrayType: self._swift_array,
+            DictType: self._swift_dict,
+            SetType: self._swift_set,
+            NullableType: self._swift_nullable,
+        }
+        # Interface name -> Swift class name
+        self._swift_class_names: dict[str, str] = {}
+        # (filter name, id(type node)) -> (type node, result)
+        self._type_filter_cache: dict[tuple[str, int], tuple[Any, Any]] = {}
+        self.enum_names = frozenset()
+
+    @property
+    def enum_names(self) -> AbstractSet[str]:
+        """Names of the enums of the current namespace."""
+        return self._enum_names
+
+    @enum_names.setter
+    def enum_names(self, value: AbstractSet[str]) -> None:
+        # Cached filter results depend on which references are enums
+        self._enum_names = value
+        self._type_filter_cache.clear()
 
     def get_custom_filters(self) -> dict[str, Any]:
         """Get Swift specific Jinja2 filters."""
@@ -59,12 +144,13 @@ class SwiftGenerator(BaseGenerator):
             "needs_optional": self.needs_optional,
             "c_to_swift_value": self.c_to_swift_value,
             "swift_to_c_value": self.swift_to_c_value,
-            "swift_to_c_param": lambda name, type_spec: self.swift_to_c_param(name, type_spec),
+            "swift_to_c_param": self.swift_to_c_param,
             "render_expression": self.render_expression,
-            "capitalize": lambda s: s[0].upper() + s[1:] if s else "",
-            "lower": lambda s: s.lower(),
+            "capitalize": _capitalize_first,
+            "lower": str.lower,
         }
 
+    @_memoize_on_node
     def swift_type(self, type_spec: Type | str) -> str:
         """Convert IDL type to Swift type.
 
@@ -74,57 +160,46 @@ class SwiftGenerator(BaseGenerator):
         Returns:
             Swift type string
         """
-        # Handle string types (for enum backing types)
-        if isinstance(type_spec, str):
-            type_map = {
-                "void": "Void",
-                "bool": "Bool",
-                "int32_t": "Int32",
-                "int64_t": "Int64",
-                "float": "Float",
-                "double": "Double",
-                "string_t": "String",
-            }
-            return type_map.get(type_spec, type_spec)
-        
-        if isinstance(type_spec, PrimitiveType):
-            type_map = {
-                "void": "Void",
-                "bool": "Bool",
-                "int32_t": "Int32",
-                "int64_t": "Int64",
-                "float": "Float",
-                "double": "Double",
-                "string_t": "String",
-            }
-            return type_map.get(type_spec.name, type_spec.name)
-
-        elif isinstance(type_spec, TypeRef):
-            # Could be enum or interface
-            if type_spec.name in self.enum_names:
-                return type_spec.name
-            else:
-                # Interface - use class name
-                return self.swift_class_name(type_spec.name)
-
-        elif isinstance(type_spec, ArrayType):
-            element_type = self.swift_type(type_spec.element_type)
-            return f"[{element_type}]"
-
-        elif isinstance(type_spec, DictType):
-            key_type = self.swift_type(type_spec.key_type)
-            value_type = self.swift_type(type_spec.value_type)
-            return f"[{key_type}: {value_type}]"
-
-        elif isinstance(type_spec, SetType):
-            element_type = self.swift_type(type_spec.element_type)
-            return f"Set<{element_type}>"
-
-        elif isinstance(type_spec, NullableType):
-            inner_type = self.swift_type(type_spec.inner_type)
-            return f"{inner_type}?"
-
-        return "Any"
+        handler = self._swift_type_dispatch.get(type_spec.__class__)
+        if handler is None:
+            return "Any"
+        return handler(type_spec)
+
+    def _swift_type_name(self, type_name: str) -> str:
+        """Map a primitive type name (e.g. an enum backing type) to Swift."""
+        return _SWIFT_PRIMITIVE_TYPES.get(type_name, type_name)
+
+    def _swift_primitive(self, type_spec: PrimitiveType) -> str:
+        """Map a primitive type to Swift."""
+        return _SWIFT_PRIMITIVE_TYPES.get(type_spec.name, type_spec.name)
+
+    def _swift_type_ref(self, type_spec: TypeRef) -> str:
+        """Map a reference to an enum or interface to Swift."""
+        if type_spec.name in self.enum_names:
+            return type_spec.name
+        # Interface - use class name
+        return self.swift_class_name(type_spec.name)
+
+    def _swift_array(self, type_spec: ArrayType) -> str:
+        """Map an array type to a Swift array."""
+        element_type = self.swift_type(type_spec.element_type)
+        return f"[{element_type}]"
+
+    def _swift_dict(self, type_spec: DictType) -> str:
+        """Map a dict type to a Swift dictionary."""
+        key_type = self.swift_type(type_spec.key_type)
+        value_type = self.swift_type(type_spec.value_type)
+        return f"[{key_type}: {value_type}]"
+
+    def _swift_set(self, type_spec: SetType) -> str:
+        """Map a set type to a Swift set."""
+        element_type = self.swift_type(type_spec.element_type)
+        return f"Set<{element_type}>"
+
+    def _swift_nullable(self, type_spec: NullableType) -> str:
+        """Map a nullable type to a Swift optional."""
+        inner_type = self.swift_type(type_spec.inner_type)
+        return f"{inner_type}?"
 
     def swift_param_type(self, type_spec: Type) -> str:
         """Get Swift parameter type.
@@ -159,55 +234,60 @@ class SwiftGenerator(BaseGenerator):
         Returns:
             Swift class name (remove I prefix if present)
         """
-        if interface_name.startswith("I") and len(interface_name) > 1:
-            return interface_name[1:]
-        return interface_name
+        class_name = self._swift_class_names.get(interface_name)
+        if class_name is None:
+            if interface_name.startswith("I") and len(interface_name) > 1:
+                class_name = interface_name[1:]
+            else:
+                class_name = interface_name
+            self._swift_class_names[interface_name] = class_name
+        return class_name
+
+    @staticmethod
+    def _unwrap(type_spec: Type) -> Type:
+        """Return the type inside any nullable wrappers."""
+        while type_spec.__class__ is NullableType:
+            type_spec = type_spec.inner_type
+        return type_spec
 
     def is_nullable(self, type_spec: Type) -> bool:
         """Check if type is nullable."""
-        return isinstance(type_spec, NullableType)
+        return type_spec.__class__ is NullableType
 
     def is_primitive(self, type_spec: Type) -> bool:
         """Check if type is primitive."""
-        if isinstance(type_spec, NullableType):
-            return self.is_primitive(type_spec.inner_type)
-        return isinstance(type_spec, PrimitiveType) and type_spec.name != "string_t"
+        type_spec = self._unwrap(type_spec)
+        return type_spec.__class__ is PrimitiveType and type_spec.name != "string_t"
 
     def is_string(self, type_spec: Type) -> bool:
         """Check if type is string."""
-        if isinstance(type_spec, NullableType):
-            return self.is_string(type_spec.inner_type)
-        return isinstance(type_spec, PrimitiveType) and type_spec.name == "string_t"
+        type_spec = self._unwrap(type_spec)
+        return type_spec.__class__ is PrimitiveType and type_spec.name == "string_t"
 
     def is_array(self, type_spec: Type) -> bool:
         """Check if type is array."""
-        if isinstance(type_spec, NullableType):
-            return self.is_array(type_spec.inner_type)
-        return isinstance(type_spec, ArrayType)
+        type_spec = self._unwrap(type_spec)
+        return type_spec.__class__ is ArrayType
 
     def is_dict(self, type_spec: Type) -> bool:
         """Check if type is dictionary."""
-        if isinstance(type_spec, NullableType):
-            return self.is_dict(type_spec.inner_type)
-        return isinstance(type_spec, DictType)
+        type_spec = self._unwrap(type_spec)
+        return type_spec.__class__ is DictType
 
     def is_set(self, type_spec: Type) -> bool:
         """Check if type is set."""
-        if isinstance(type_spec, NullableType):
-            return self.is_set(type_spec.inner_type)
-        return isinstance(type_spec, SetType)
+        type_spec = self._unwrap(type_spec)
+        return type_spec.__class__ is SetType
 
     def is_interface(self, type_spec: Type) -> bool:
         """Check if type is an interface reference."""
-        if isinstance(type_spec, NullableType):
-            return self.is_interface(type_spec.inner_type)
-        return isinstance(type_spec, TypeRef) and type_spec.name not in self.enum_names
+        type_spec = self._unwrap(type_spec)
+        return type_spec.__class__ is TypeRef and type_spec.name not in self.enum_names
 
     def is_enum(self, type_spec: Type) -> bool:
         """Check if type is an enum."""
-        if isinstance(type_spec, NullableType):
-            return self.is_enum(type_spec.inner_type)
-        return isinstance(type_spec, TypeRef) and type_spec.name in self.enum_names
+        type_spec = self._unwrap(type_spec)
+        return type_spec.__class__ is TypeRef and type_spec.name in self.enum_names
 
     def needs_optional(self, type_spec: Type) -> bool:
         """Check if type needs optional handling in Swift."""
@@ -278,8 +358,9 @@ class SwiftGenerator(BaseGenerator):
             return f"{param_name}.cValue"
         return self.swift_to_c_value(param_name, param_type)
 
+    @_memoize_on_node
     def render_expression(self, expr: Expression) -> str:
-        """Render an expression to Swift code.
+        """Render an expression to Swift code, once per expression node.
 
         Args:
             expr: Expression AST node
@@ -287,32 +368,7 @@ class SwiftGenerator(BaseGenerator):
         Returns:
             Swift expression string
         """
-        if isinstance(expr, LiteralExpression):
-            if expr.base == "hex":
-                return f"0x{expr.value:X}"
-            elif expr.base == "binary":
-                return f"0b{expr.value:b}"
-            else:
-                return str(expr.value)
-
-        elif isinstance(expr, IdentifierExpression):
-            return expr.name
-
-        elif isinstance(expr, UnaryExpression):
-            operand = self.render_expression(expr.operand)
-            return f"{expr.operator}{operand}"
-
-        elif isinstance(expr, BinaryExpression):
-            left = self.render_expression(expr.left)
-            right = self.render_expression(expr.right)
-            return f"({left} {expr.operator} {right})"
-
-        elif isinstance(expr, ParenthesizedExpression):
-            inner = self.render_expression(expr.expression)
-            return f"({inner})"
-
-        # Fallback for direct values
-        return str(expr)
+        return super().render_expression(expr)
 
     def generate(self, idl_file: IDLFile, output_dir: Path) -> list[Path]:
         """Generate Swift bindings from AST.
@@ -324,76 +380,57 @@ class SwiftGenerator(BaseGenerator):
         Returns:
             List of generated file paths
         """
-        generated_files = []
+        files: list[tuple[Path, str]] = []
+
+        # Load templates once for all namespaces
+        package_template = self.get_template("swift/Package.swift.j2")
+        types_template = self.get_template("swift/Types.swift.j2")
+        wrapper_template = self.get_template("swift/wrapper.swift.j2")
+        modulemap_template = self.get_template("swift/module.modulemap.j2")
+        readme_template = self.get_template("swift/README.md.j2")
+        basic_tests_template = self.get_template("swift/BasicTests.swift.j2")
 
         # For each namespace, create a Swift package
         for namespace in idl_file.namespaces:
             self.namespace_name = namespace.name
             self.c_gen.namespace_prefix = namespace.name
-            self.enum_names = {enum.name for enum in namespace.enums}
+            self.enum_names = frozenset(enum.name for enum in namespace.enums)
             self.c_gen.enum_names = self.enum_names
 
-            # Create package directory
+            # Package layout; write_files creates the directories
             package_dir = output_dir / namespace.name
-            package_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create Sources directory
             sources_dir = package_dir / "Sources" / namespace.name
-            sources_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create C wrapper module directory
             c_module_dir = package_dir / "Sources" / f"{namespace.name}C"
-            c_module_dir.mkdir(parents=True, exist_ok=True)
+            tests_dir = package_dir / "Tests" / f"{namespace.name}Tests"
 
             # Generate Package.swift
-            package_template = self.get_template("swift/Package.swift.j2")
             package_content = package_template.render(namespace=namespace)
-            package_path = self.write_file(
-                package_dir, "Package.swift", package_content
-            )
-            generated_files.append(package_path)
+            files.append((package_dir / "Package.swift", package_content))
 
             # Generate Types.swift (enums and typedefs)
-            types_template = self.get_template("swift/Types.swift.j2")
             types_content = types_template.render(namespace=namespace)
-            types_path = self.write_file(sources_dir, "Types.swift", types_content)
-            generated_files.append(types_path)
+            files.append((sources_dir / "Types.swift", types_content))
 
             # Generate wrapper classes
-            wrapper_template = self.get_template("swift/wrapper.swift.j2")
             wrapper_content = wrapper_template.render(namespace=namespace)
-            wrapper_path = self.write_file(
-                sources_dir, f"{namespace.name}.swift", wrapper_content
-            )
-            generated_files.append(wrapper_path)
+            files.append((sources_dir / f"{namespace.name}.swift", wrapper_content))
 
             # Generate module map
-            modulemap_template = self.get_template("swift/module.modulemap.j2")
             modulemap_content = modulemap_template.render(namespace=namespace)
-            modulemap_path = self.write_file(
-                c_module_dir, "module.modulemap", modulemap_content
-            )
-            generated_files.append(modulemap_path)
+            files.append((c_module_dir / "module.modulemap", modulemap_content))
 
             # Generate README
-            readme_template = self.get_template("swift/README.md.j2")
             readme_content = readme_template.render(namespace=namespace)
-            readme_path = self.write_file(package_dir, "README.md", readme_content)
-            generated_files.append(readme_path)
-
-            # Create Tests directory
-            tests_dir = package_dir / "Tests" / f"{namespace.name}Tests"
-            tests_dir.mkdir(parents=True, exist_ok=True)
+            files.append((package_dir / "README.md", readme_content))
 
             # Generate basic tests
-            basic_tests_template = self.get_template("swift/BasicTests.swift.j2")
             basic_tests_content = basic_tests_template.render(namespace=namespace)
-            basic_tests_path = self.write_file(
-                tests_dir, f"{namespace.name}Tests.swift", basic_tests_content
+            files.append(
+                (tests_dir / f"{namespace.name}Tests.swift", basic_tests_content)
             )
-            generated_files.append(basic_tests_path)
 
-        return generated_files
+        # Write all rendered files
+        return self.write_files(files)
 
     def get_output_filename(self, namespace_name: str) -> str:
         """Get output filename for a namespace.
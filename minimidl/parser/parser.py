@@ -1,5 +1,6 @@
 """IDL parser implementation using Lark."""
 
+from functools import cache
 from pathlib import Path
 from typing import Any, overload
 
@@ -13,29 +14,45 @@ from minimidl.ast.transformer import IDLTransformer
 GRAMMAR_FILE = Path(__file__).parent / "grammar.lark"
 
 
+@cache
+def _grammar_text() -> str:
+    """Return the grammar source, read from disk once per process."""
+    return GRAMMAR_FILE.read_text(encoding="utf-8")
+
+
+@cache
+def _shared_lark() -> Lark:
+    """Create the Lark parser shared by all IDLParser instances.
+
+    Lark parsers keep no state between parses, so building the LALR tables
+    once per process is enough. The contextual lexer is kept on purpose: it
+    lets keywords such as ``set`` or ``dict`` double as identifiers.
+
+    Returns:
+        Configured Lark parser instance.
+    """
+    return Lark(
+        _grammar_text(),
+        parser="lalr",
+        debug=False,
+        # AST positions come from the name tokens, which always carry them, so
+        # tree nodes don't need line/column metadata of their own
+        propagate_positions=False,
+        maybe_placeholders=False,
+        # Reuse the LALR tables pickled in the temp directory by an earlier
+        # process; Lark keys the file on the grammar and these options
+        cache=True,
+    )
+
+
 class IDLParser:
     """MinimIDL parser using Lark grammar."""
 
     def __init__(self) -> None:
         """Initialize the parser with the IDL grammar."""
-        self._parser = self._create_parser()
+        self._parser = _shared_lark()
         self._transformer = IDLTransformer()
 
-    def _create_parser(self) -> Lark:
-        """Create and configure the Lark parser.
-
-        Returns:
-            Configured Lark parser instance.
-        """
-        grammar_text = GRAMMAR_FILE.read_text(encoding="utf-8")
-        return Lark(
-            grammar_text,
-            parser="lalr",
-            debug=False,
-            propagate_positions=True,
-            maybe_placeholders=False,
-        )
-
     @overload
     def parse(self, idl_content: str, *, transform: bool = True) -> IDLFile: ...
 
@@ -101,7 +118,8 @@ class IDLParser:
             raise FileNotFoundError(f"IDL file not found: {path}")
 
         logger.info(f"Parsing IDL file: {path}")
-        content = path.read_text(encoding="utf-8")
+        # Decoding the raw bytes skips the text-mode file wrapper
+        content = path.read_bytes().decode("utf-8")
         ast = self.parse(content, transform=transform)
 
         # Set source file on AST if transformed
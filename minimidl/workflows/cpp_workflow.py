@@ -6,8 +6,89 @@ from typing import Any
 from loguru import logger
 
 from minimidl.ast.nodes import IDLFile
+from minimidl.generators.base import strip_i_prefix, write_files
 from minimidl.generators.cpp import CppGenerator
 
+# Static project files; they don't depend on the IDL being generated
+_CPP_BUILD_SCRIPT = """#!/bin/bash
+# Build script for C++ project
+
+set -e
+
+# Colors for output
+GREEN='\\033[0;32m'
+RED='\\033[0;31m'
+NC='\\033[0m' # No Color
+
+echo "Building project..."
+
+# Create build directory
+mkdir -p build
+cd build
+
+# Configure with CMake
+echo "Configuring..."
+cmake .. -DCMAKE_BUILD_TYPE=Release
+
+# Build
+echo "Compiling..."
+make -j$(nproc 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 1)
+
+# Run tests
+echo "Running tests..."
+ctest --output-on-failure
+
+echo -e "${GREEN}Build complete!${NC}"
+echo ""
+echo "To run the example:"
+echo "  ./build/example"
+"""
+
+_CPP_RUNTIME_HEADER = """#pragma once
+// MinimIDL Runtime Support Library
+// This header provides base classes and utilities for generated code
+
+#include <string>
+#include <vector>
+#include <memory>
+#include <unordered_map>
+#include <atomic>
+
+namespace minimidl {
+
+// Base class for reference counted objects
+class RefCounted {
+protected:
+    mutable std::atomic<int32_t> m_refCount{1};
+    
+public:
+    virtual ~RefCounted() = default;
+    
+    void AddRef() const {
+        m_refCount.fetch_add(1, std::memory_order_relaxed);
+    }
+    
+    void Release() const {
+        if (m_refCount.fetch_sub(1, std::memory_order_acq_rel) == 1) {
+            delete this;
+        }
+    }
+};
+
+// String type for IDL compatibility
+using string_t = std::string;
+
+// Array type template
+template<typename T>
+using array_t = std::vector<T>;
+
+// Dictionary type template
+template<typename K, typename V>
+using dict_t = std::unordered_map<K, V>;
+
+} // namespace minimidl
+"""
+
 
 class CppWorkflow:
     """Workflow for generating complete C++ projects."""
@@ -44,6 +125,9 @@ class CppWorkflow:
         # Create project structure
         project_dir = output_dir / (project_name or "generated")
         project_dir.mkdir(parents=True, exist_ok=True)
+        # Name used inside the generated files; the directory fallback above
+        # is lower-case on purpose
+        name = project_name or "Generated"
 
         # Create standard C++ project directories
         include_dir = project_dir / "include"
@@ -58,37 +142,23 @@ class CppWorkflow:
         cpp_files = self.generator.generate(idl_file, include_dir)
         generated_files.extend(cpp_files)
 
-        # Generate CMakeLists.txt
-        cmake_content = self._generate_cmake(project_name or "Generated", idl_file)
-        cmake_path = self._write_file(project_dir / "CMakeLists.txt", cmake_content)
-        generated_files.append(cmake_path)
-
-        # Generate README
-        readme_content = self._generate_readme(project_name or "Generated", idl_file)
-        readme_path = self._write_file(project_dir / "README.md", readme_content)
-        generated_files.append(readme_path)
-
-        # Generate minimidl_runtime.hpp
-        runtime_content = self._generate_runtime_header()
-        runtime_path = self._write_file(include_dir / "minimidl_runtime.hpp", runtime_content)
-        generated_files.append(runtime_path)
-
-
-        # Generate example code
-        example_content = self._generate_example(project_name or "Generated", idl_file)
-        example_path = self._write_file(src_dir / "example.cpp", example_content)
-        generated_files.append(example_path)
-
-        # Generate test stub
-        test_content = self._generate_test(project_name or "Generated", idl_file)
-        test_path = self._write_file(tests_dir / "test_main.cpp", test_content)
-        generated_files.append(test_path)
-
-        # Generate build script
-        build_content = self._generate_build_script()
-        build_path = self._write_file(project_dir / "build.sh", build_content)
-        build_path.chmod(0o755)  # Make executable
-        generated_files.append(build_path)
+        # Render the project files, then write them together
+        files = [
+            # CMakeLists.txt
+            (project_dir / "CMakeLists.txt", self._generate_cmake(name, idl_file)),
+            # README
+            (project_dir / "README.md", self._generate_readme(name, idl_file)),
+            # minimidl_runtime.hpp
+            (include_dir / "minimidl_runtime.hpp", self._generate_runtime_header()),
+            # Example code
+            (src_dir / "example.cpp", self._generate_example(name, idl_file)),
+            # Test stub
+            (tests_dir / "test_main.cpp", self._generate_test(name, idl_file)),
+            # Build script
+            (project_dir / "build.sh", self._generate_build_script()),
+        ]
+        generated_files.extend(write_files(files))
+        (project_dir / "build.sh").chmod(0o755)  # Make executable
 
         logger.success(
             f"Generated C++ project with {len(generated_files)} files in {project_dir}"
@@ -161,13 +231,14 @@ install(TARGETS ${{PROJECT_NAME}}_interface
 
     def _generate_readme(self, project_name: str, idl_file: IDLFile) -> str:
         """Generate README.md content."""
-        interfaces = []
-        enums = []
+        interfaces: list[str] = []
+        enums: list[str] = []
         for namespace in idl_file.namespaces:
-            interfaces.extend(
-                [f"- `{namespace.name}::{iface.name}`" for iface in namespace.interfaces]
-            )
-            enums.extend([f"- `{namespace.name}::{enum.name}`" for enum in namespace.enums])
+            namespace_name = namespace.name
+            for iface in namespace.interfaces:
+                interfaces.append(f"- `{namespace_name}::{iface.name}`")
+            for enum in namespace.enums:
+                enums.append(f"- `{namespace_name}::{enum.name}`")
 
         interfaces_section = "\n".join(interfaces) if interfaces else "No interfaces defined"
         enums_section = "\n".join(enums) if enums else "No enums defined"
@@ -249,11 +320,12 @@ This code was automatically generated. Do not edit manually.
 
             # Generate example comment for interfaces
             for iface in namespace.interfaces:
+                class_name = strip_i_prefix(iface.name)
                 code_examples.append(
                     f"""
     // TODO: Implement {namespace.name}::{iface.name}
     // Example:
-    // class {iface.name[1:] if iface.name.startswith("I") else iface.name}Impl : public {namespace.name}::{iface.name} {{
+    // class {class_name}Impl : public {namespace.name}::{iface.name} {{
     //     // Implement all pure virtual methods
     // }};"""
                 )
@@ -327,98 +399,8 @@ int main() {{
 
     def _generate_build_script(self) -> str:
         """Generate build.sh script."""
-        return """#!/bin/bash
-# Build script for C++ project
-
-set -e
-
-# Colors for output
-GREEN='\\033[0;32m'
-RED='\\033[0;31m'
-NC='\\033[0m' # No Color
-
-echo "Building project..."
-
-# Create build directory
-mkdir -p build
-cd build
-
-# Configure with CMake
-echo "Configuring..."
-cmake .. -DCMAKE_BUILD_TYPE=Release
-
-# Build
-echo "Compiling..."
-make -j$(nproc 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 1)
-
-# Run tests
-echo "Running tests..."
-ctest --output-on-failure
-
-echo -e "${GREEN}Build complete!${NC}"
-echo ""
-echo "To run the example:"
-echo "  ./build/example"
-"""
+        return _CPP_BUILD_SCRIPT
 
     def _generate_runtime_header(self) -> str:
         """Generate minimidl_runtime.hpp content."""
-        return """#pragma once
-// MinimIDL Runtime Support Library
-// This header provides base classes and utilities for generated code
-
-#include <string>
-#include <vector>
-#include <memory>
-#include <unordered_map>
-#include <atomic>
-
-namespace minimidl {
-
-// Base class for reference counted objects
-class RefCounted {
-protected:
-    mutable std::atomic<int32_t> m_refCount{1};
-    
-public:
-    virtual ~RefCounted() = default;
-    
-    void AddRef() const {
-        m_refCount.fetch_add(1, std::memory_order_relaxed);
-    }
-    
-    void Release() const {
-        if (m_refCount.fetch_sub(1, std::memory_order_acq_rel) == 1) {
-            delete this;
-        }
-    }
-};
-
-// String type for IDL compatibility
-using string_t = std::string;
-
-// Array type template
-template<typename T>
-using array_t = std::vector<T>;
-
-// Dictionary type template
-template<typename K, typename V>
-using dict_t = std::unordered_map<K, V>;
-
-} // namespace minimidl
-"""
-
-    def _write_file(self, path: Path, content: str) -> Path:
-        """Write content to file.
-
-        Args:
-            path: File path
-            content: File content
-
-        Returns:
-            Path to written file
-        """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
-        logger.debug(f"Wrote {path}")
-        return path
\ No newline at end of file
+        return _CPP_RUNTIME_HEADER
@@ -6,6 +6,7 @@ from typing import Any
 from loguru import logger
 
 from minimidl.ast.nodes import IDLFile
+from minimidl.generators.base import strip_i_prefix, write_files
 from minimidl.generators.c_wrapper import CWrapperGenerator
 from minimidl.generators.swift import SwiftGenerator
 
@@ -20,8 +21,10 @@ class SwiftWorkflow:
             config: Optional configuration options
         """
         self.config = config or {}
-        self.swift_generator = SwiftGenerator()
         self.c_wrapper_generator = CWrapperGenerator()
+        # The Swift bindings call the C wrapper's functions, so both share one
+        # generator and its memoized names instead of each building their own
+        self.swift_generator = SwiftGenerator(c_gen=self.c_wrapper_generator)
 
     def generate_project(
         self, idl_file: IDLFile, output_dir: Path, project_name: str | None = None
@@ -74,21 +77,20 @@ class SwiftWorkflow:
         swift_files = self.swift_generator.generate(idl_file, project_dir)
         generated_files.extend(swift_files)
 
-        # Generate build scripts
-        build_c_content = self._generate_c_build_script(project_name)
-        build_c_path = self._write_file(project_dir / "build_c.sh", build_c_content)
+        # Generate build scripts and comprehensive README, written together
+        build_c_path = project_dir / "build_c.sh"
+        build_swift_path = project_dir / "build_swift.sh"
+        project_files = [
+            (build_c_path, self._generate_c_build_script(project_name)),
+            (build_swift_path, self._generate_swift_build_script(project_name)),
+            (
+                project_dir / "README.md",
+                self._generate_project_readme(project_name, idl_file),
+            ),
+        ]
+        generated_files.extend(write_files(project_files))
         build_c_path.chmod(0o755)
-        generated_files.append(build_c_path)
-
-        build_swift_content = self._generate_swift_build_script(project_name)
-        build_swift_path = self._write_file(project_dir / "build_swift.sh", build_swift_content)
         build_swift_path.chmod(0o755)
-        generated_files.append(build_swift_path)
-
-        # Generate comprehensive README
-        readme_content = self._generate_project_readme(project_name, idl_file)
-        readme_path = self._write_file(project_dir / "README.md", readme_content)
-        generated_files.append(readme_path)
 
         # Generate example app
         example_files = self._generate_example_app(project_name, idl_file, project_dir)
@@ -103,39 +105,42 @@ class SwiftWorkflow:
         self, idl_file: IDLFile, output_dir: Path
     ) -> list[Path]:
         """Generate C++ implementation stubs."""
-        generated = []
+        files = []
 
         for namespace in idl_file.namespaces:
-            # Generate implementation header
-            impl_h_content = self._generate_impl_header(namespace)
-            impl_h_path = self._write_file(
-                output_dir / f"{namespace.name}_impl.hpp", impl_h_content
+            # Implementation header and source
+            files.append(
+                (
+                    output_dir / f"{namespace.name}_impl.hpp",
+                    self._generate_impl_header(namespace),
+                )
             )
-            generated.append(impl_h_path)
-
-            # Generate implementation source
-            impl_cpp_content = self._generate_impl_source(namespace)
-            impl_cpp_path = self._write_file(
-                output_dir / f"{namespace.name}_impl.cpp", impl_cpp_content
+            files.append(
+                (
+                    output_dir / f"{namespace.name}_impl.cpp",
+                    self._generate_impl_source(namespace),
+                )
             )
-            generated.append(impl_cpp_path)
 
         # Generate CMakeLists.txt for C implementation
-        cmake_content = self._generate_impl_cmake(idl_file)
-        cmake_path = self._write_file(output_dir / "CMakeLists.txt", cmake_content)
-        generated.append(cmake_path)
+        files.append(
+            (output_dir / "CMakeLists.txt", self._generate_impl_cmake(idl_file))
+        )
 
-        return generated
+        return write_files(files)
 
     def _generate_impl_header(self, namespace: Any) -> str:
         """Generate implementation header stub."""
         includes = f'#include "{namespace.name}_wrapper.h"\n#include <string>\n#include <vector>\n#include <memory>'
 
-        impl_classes = []
+        # Build the file in one buffer instead of joining the class stubs into
+        # a section and then copying that into the surrounding text
+        parts = [f"#pragma once\n\n{includes}\n\nnamespace {namespace.name} {{\n"]
+        separator = ""
         for interface in namespace.interfaces:
-            class_name = interface.name[1:] if interface.name.startswith("I") else interface.name
-            impl_classes.append(
-                f"""
+            class_name = strip_i_prefix(interface.name)
+            parts.append(
+                f"""{separator}
 // Implementation of {interface.name}
 class {class_name}Impl {{
 public:
@@ -146,18 +151,10 @@ public:
     // This is a stub implementation for demonstration
 }};"""
             )
+            separator = "\n"
+        parts.append(f"\n\n}} // namespace {namespace.name}\n")
 
-        impl_section = "\n".join(impl_classes)
-
-        return f"""#pragma once
-
-{includes}
-
-namespace {namespace.name} {{
-{impl_section}
-
-}} // namespace {namespace.name}
-"""
+        return "".join(parts)
 
     def _generate_impl_source(self, namespace: Any) -> str:
         """Generate implementation source stub."""
@@ -283,7 +280,7 @@ echo "To run tests: cd {project_name} && swift test"
         interfaces = []
         for namespace in idl_file.namespaces:
             for iface in namespace.interfaces:
-                swift_name = iface.name[1:] if iface.name.startswith("I") else iface.name
+                swift_name = strip_i_prefix(iface.name)
                 interfaces.append(f"- `{swift_name}` (from {namespace.name}::{iface.name})")
 
         interfaces_list = "\n".join(interfaces) if interfaces else "No interfaces defined"
@@ -383,29 +380,28 @@ This code was automatically generated. Do not edit the generated files in the Sw
         self, project_name: str, idl_file: IDLFile, project_dir: Path
     ) -> list[Path]:
         """Generate example iOS/macOS app."""
-        generated = []
-        
         app_dir = project_dir / "ExampleApp"
         app_dir.mkdir(exist_ok=True)
 
-        # Generate ContentView.swift
-        content_view = self._generate_content_view(project_name, idl_file)
-        content_path = self._write_file(app_dir / "ContentView.swift", content_view)
-        generated.append(content_path)
-
-        # Generate App.swift
-        app_swift = self._generate_app_swift(project_name)
-        app_path = self._write_file(app_dir / f"{project_name}App.swift", app_swift)
-        generated.append(app_path)
-
-        # Generate example project file
-        proj_content = self._generate_xcodeproj_stub(project_name)
-        proj_path = self._write_file(
-            app_dir / f"{project_name}Example.xcodeproj.md", proj_content
+        return write_files(
+            [
+                # ContentView.swift
+                (
+                    app_dir / "ContentView.swift",
+                    self._generate_content_view(project_name, idl_file),
+                ),
+                # App.swift
+                (
+                    app_dir / f"{project_name}App.swift",
+                    self._generate_app_swift(project_name),
+                ),
+                # Example project file
+                (
+                    app_dir / f"{project_name}Example.xcodeproj.md",
+                    self._generate_xcodeproj_stub(project_name),
+                ),
+            ]
         )
-        generated.append(proj_path)
-
-        return generated
 
     def _generate_content_view(self, project_name: str, idl_file: IDLFile) -> str:
         """Generate SwiftUI ContentView."""
@@ -484,18 +480,3 @@ To create an Xcode project for this example:
 
 Note: Ensure you've built the C libraries first using ../build_c.sh
 """
-
-    def _write_file(self, path: Path, content: str) -> Path:
-        """Write content to file.
-
-        Args:
-            path: File path
-            content: File content
-
-        Returns:
-            Path to written file
-        """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
-        logger.debug(f"Wrote {path}")
-        return path
\ No newline at end of file
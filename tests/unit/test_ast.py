@@ -198,9 +198,12 @@ class TestASTTransformation:
         # Check SHIFTED
         shifted = ns.constants[2]
         assert shifted.name == "SHIFTED"
-        # Note: expressions in constants are not evaluated, just the first value is kept
-        assert isinstance(shifted.constant_value.value, LiteralExpression)
-        assert shifted.constant_value.value.value == 1  # Just the first value
+        # Expressions in constants are kept as a tree, not evaluated
+        shift = shifted.constant_value.value
+        assert isinstance(shift, BinaryExpression)
+        assert shift.operator == "<<"
+        assert shift.left.value == 1
+        assert shift.right.value == 8
 
     def test_forward_declaration(self) -> None:
         """Test forward declaration transformation."""
@@ -386,7 +389,7 @@ class TestASTNodeValidation:
             assert prim.name == type_name
 
         # Invalid primitive type
-        with pytest.raises(ValueError, match="Invalid primitive type"):
+        with pytest.raises(ValueError, match="Input should be 'void'"):
             PrimitiveType(name="invalid_type")
 
     def test_enum_backing_type_validation(self) -> None:
@@ -397,7 +400,7 @@ class TestASTNodeValidation:
             assert enum.backing_type == backing
 
         # Invalid backing type
-        with pytest.raises(ValueError, match="Invalid enum backing type"):
+        with pytest.raises(ValueError, match="Input should be 'int32_t' or 'int64_t'"):
             Enum(name="Test", backing_type="float")
 
     def test_constant_type_validation(self) -> None:
@@ -408,7 +411,7 @@ class TestASTNodeValidation:
             assert const_val.type == const_type
 
         # Invalid constant type
-        with pytest.raises(ValueError, match="Invalid constant type"):
+        with pytest.raises(ValueError, match="Input should be 'int32_t'"):
             ConstantValue(type="string_t", value=LiteralExpression(value=0))
 
 
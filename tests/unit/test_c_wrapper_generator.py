@@ -6,6 +6,7 @@ import pytest
 
 from minimidl.ast.nodes import (
     ArrayType,
+    BinaryExpression,
     DictType,
     Enum,
     EnumValue,
@@ -20,6 +21,7 @@ from minimidl.ast.nodes import (
     Property,
     SetType,
     TypeRef,
+    UnaryExpression,
 )
 from minimidl.generators.c_wrapper import CWrapperGenerator
 
@@ -47,6 +49,20 @@ class TestCWrapperTypeMapping:
         type_ref = TypeRef(name="ILogger")
         assert generator.c_type(type_ref) == "ILogger_Handle"
 
+    def test_cached_types_follow_namespace_state(self, generator):
+        """Test that cached C types are dropped when the namespace changes."""
+        type_ref = TypeRef(name="Status")
+        assert generator.c_type(type_ref) == "Status_Handle"
+
+        generator.enum_names = {"Status"}
+        assert generator.c_type(type_ref) == "Status"
+
+        array_type = ArrayType(element_type=PrimitiveType(name="int32_t"))
+        generator.namespace_prefix = "First"
+        assert generator.c_type(array_type) == "FirstArray_Handle"
+        generator.namespace_prefix = "Second"
+        assert generator.c_type(array_type) == "SecondArray_Handle"
+
     def test_collection_types(self, generator):
         """Test collection type mapping."""
         generator.namespace_prefix = "Test"
@@ -125,6 +141,19 @@ class TestCWrapperTypeMapping:
             == True
         )
 
+    def test_render_expression(self, generator):
+        """Test expression rendering to C."""
+        # C has no binary literals, so they are rendered as hex
+        expr = LiteralExpression(value=5, base="binary")
+        assert generator.render_expression(expr) == "0x5"
+
+        expr = BinaryExpression(
+            operator="|",
+            left=UnaryExpression(operator="~", operand=LiteralExpression(value=1)),
+            right=LiteralExpression(value=255, base="hex"),
+        )
+        assert generator.render_expression(expr) == "(~1 | 0xFF)"
+
 
 class TestCWrapperGeneration:
     """Test full C wrapper code generation."""
@@ -1,5 +1,7 @@
 """Unit tests for CLI module."""
 
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -66,6 +68,13 @@ namespace Test {
         assert result.exit_code == 0
         assert '"namespaces"' in result.output
 
+    def test_parse_json_output_omits_union_tags(self, runner, sample_idl_file):
+        """Test that the kind discriminator is left out of the JSON output."""
+        result = runner.invoke(app, ["parse", str(sample_idl_file), "--json"])
+        assert result.exit_code == 0
+        assert '"string_t"' in result.output
+        assert '"kind"' not in result.output
+
     def test_parse_json_to_file(self, runner, sample_idl_file, tmp_path):
         """Test parse command with JSON output to file."""
         output_file = tmp_path / "ast.json"
@@ -97,7 +106,7 @@ namespace Test {
         assert result.exit_code == 1
         assert "Error:" in result.output
 
-    @patch("minimidl.cli.CppWorkflow")
+    @patch("minimidl.workflows.cpp_workflow.CppWorkflow")
     def test_generate_cpp(self, mock_workflow, runner, sample_idl_file, tmp_path):
         """Test generate command with C++ target."""
         mock_instance = MagicMock()
@@ -112,7 +121,7 @@ namespace Test {
         assert "Generated" in result.output
         assert "CPP files" in result.output
 
-    @patch("minimidl.cli.SwiftWorkflow")
+    @patch("minimidl.workflows.swift_workflow.SwiftWorkflow")
     def test_generate_swift(self, mock_workflow, runner, sample_idl_file, tmp_path):
         """Test generate command with Swift target."""
         mock_instance = MagicMock()
@@ -127,7 +136,7 @@ namespace Test {
         assert "Generated" in result.output
         assert "SWIFT files" in result.output
 
-    @patch("minimidl.cli.CWrapperGenerator")
+    @patch("minimidl.generators.c_wrapper.CWrapperGenerator")
     def test_generate_c_direct(self, mock_gen, runner, sample_idl_file, tmp_path):
         """Test generate command with C target (direct generator)."""
         mock_instance = MagicMock()
@@ -143,9 +152,9 @@ namespace Test {
 
     def test_generate_all_targets(self, runner, sample_idl_file, tmp_path):
         """Test generate command with all targets."""
-        with patch("minimidl.cli.CppWorkflow") as mock_cpp, \
-             patch("minimidl.cli.CWrapperGenerator") as mock_c, \
-             patch("minimidl.cli.SwiftWorkflow") as mock_swift:
+        with patch("minimidl.workflows.cpp_workflow.CppWorkflow") as mock_cpp, \
+             patch("minimidl.generators.c_wrapper.CWrapperGenerator") as mock_c, \
+             patch("minimidl.workflows.swift_workflow.SwiftWorkflow") as mock_swift:
             
             # Setup mocks
             for mock in [mock_cpp, mock_c, mock_swift]:
@@ -156,7 +165,14 @@ namespace Test {
             
             result = runner.invoke(
                 app,
-                ["generate", str(sample_idl_file), "--target", "all", "-o", str(tmp_path)]
+                [
+                    "generate",
+                    str(sample_idl_file),
+                    "--target",
+                    "all",
+                    "-o",
+                    str(tmp_path),
+                ],
             )
             assert result.exit_code == 0
             assert "CPP files" in result.output
@@ -175,19 +191,59 @@ namespace Test {
     def test_generate_with_ast_caching(self, runner, sample_idl_file, tmp_path):
         """Test generate command with AST caching."""
         with patch("minimidl.cli.save_ast") as mock_save:
-            with patch("minimidl.cli.CppWorkflow") as mock_workflow:
+            with patch("minimidl.workflows.cpp_workflow.CppWorkflow") as mock_workflow:
                 mock_instance = MagicMock()
                 mock_instance.generate_project.return_value = []
                 mock_workflow.return_value = mock_instance
                 
                 result = runner.invoke(
                     app,
-                    ["generate", str(sample_idl_file), "--cache-ast", "-o", str(tmp_path)]
+                    [
+                        "generate",
+                        str(sample_idl_file),
+                        "--cache-ast",
+                        "-o",
+                        str(tmp_path),
+                    ],
                 )
                 assert result.exit_code == 0
                 assert "AST cached" in result.output
                 mock_save.assert_called_once()
 
+    def test_generate_reuses_up_to_date_ast_cache(
+        self, runner, sample_idl_file, tmp_path
+    ):
+        """Test that an AST cache matching the IDL source skips parsing."""
+        args = [
+            "generate",
+            str(sample_idl_file),
+            "--cache-ast",
+            "-t",
+            "cpp",
+            "-o",
+            str(tmp_path),
+        ]
+
+        with patch("minimidl.workflows.cpp_workflow.CppWorkflow") as mock_workflow:
+            mock_workflow.return_value.generate_project.return_value = []
+
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            assert sample_idl_file.with_suffix(".ast").exists()
+
+            with patch("minimidl.cli._get_parser") as mock_get_parser:
+                result = runner.invoke(app, args)
+                assert result.exit_code == 0
+                mock_get_parser.assert_not_called()
+
+            # Changing the source invalidates the cache
+            sample_idl_file.write_text("namespace Other {}")
+            with patch("minimidl.cli._get_parser") as mock_get_parser:
+                mock_get_parser.return_value.parse.return_value = IDLFile(namespaces=[])
+                result = runner.invoke(app, args)
+                assert result.exit_code == 0
+                mock_get_parser.assert_called_once()
+
     def test_generate_from_ast(self, runner, tmp_path):
         """Test generate command from cached AST."""
         # Create a mock AST file
@@ -197,7 +253,7 @@ namespace Test {
         with patch("minimidl.cli.load_ast") as mock_load:
             mock_load.return_value = IDLFile(namespaces=[])
             
-            with patch("minimidl.cli.CppWorkflow") as mock_workflow:
+            with patch("minimidl.workflows.cpp_workflow.CppWorkflow") as mock_workflow:
                 mock_instance = MagicMock()
                 mock_instance.generate_project.return_value = []
                 mock_workflow.return_value = mock_instance
@@ -237,11 +293,20 @@ namespace Test {
 }
 """)
         
-        with patch("minimidl.cli.SemanticValidator") as mock_validator:
+        with patch("minimidl.cli._get_validator") as mock_get_validator:
             mock_instance = MagicMock()
             mock_instance.validate.return_value = ["Unknown type 'UnknownType'"]
-            mock_validator.return_value = mock_instance
+            mock_get_validator.return_value = mock_instance
             
             result = runner.invoke(app, ["parse", str(bad_idl)])
             assert result.exit_code == 1
-            assert "Validation errors" in result.output
\ No newline at end of file
+            assert "Validation errors" in result.output
+
+    def test_generators_not_imported_at_startup(self):
+        """Test that importing the CLI leaves the generators unloaded."""
+        code = (
+            "import sys, minimidl.cli; "
+            "sys.exit('minimidl.generators.base' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code])
+        assert result.returncode == 0
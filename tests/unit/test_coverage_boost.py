@@ -38,11 +38,6 @@ class TestTransformerCoverage:
         # Test empty enum values
         result = transformer.enum_values([])
         assert result == []
-        
-        # Test expression with single item
-        result = transformer.expression([LiteralExpression(value=42)])
-        assert isinstance(result, LiteralExpression)
-        assert result.value == 42
 
 
 class TestParserCoverage:
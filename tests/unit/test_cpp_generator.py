@@ -1,5 +1,6 @@
 """Tests for C++ code generator."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -26,6 +27,7 @@ from minimidl.ast.nodes import (
     SetType,
     Typedef,
     TypeRef,
+    UnaryExpression,
 )
 from minimidl.generators.cpp import CppGenerator
 
@@ -153,6 +155,14 @@ class TestExpressionRendering:
         )
         assert generator.render_expression(expr) == "((1 << 4) | 0xFF)"
 
+    def test_deeply_nested_expression(self, generator):
+        """Test rendering nesting deeper than the recursion limit."""
+        depth = 5000
+        expr = LiteralExpression(value=1)
+        for _ in range(depth):
+            expr = UnaryExpression.model_construct(operator="-", operand=expr)
+        assert generator.render_expression(expr) == "-" * depth + "1"
+
 
 class TestCodeGeneration:
     """Test full code generation."""
@@ -228,6 +238,22 @@ class TestCodeGeneration:
         assert "OK = 0," in content
         assert "ERROR = 1," in content
 
+    def test_regeneration_skips_unchanged_files(self, generator, tmp_path):
+        """Test that regenerating identical output leaves files untouched."""
+        namespace = Namespace(name="Example")
+        idl_file = IDLFile(namespaces=[namespace])
+
+        (output,) = generator.generate(idl_file, tmp_path)
+        os.utime(output, (0, 0))
+
+        generator.generate(idl_file, tmp_path)
+        assert output.stat().st_mtime == 0
+
+        # A modified file is restored
+        output.write_text("stale")
+        generator.generate(idl_file, tmp_path)
+        assert "namespace Example" in output.read_text()
+
     def test_property_generation(self, generator, tmp_path):
         """Test property generation."""
         namespace = Namespace(
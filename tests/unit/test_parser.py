@@ -3,7 +3,7 @@
 import pytest
 from lark import ParseError, Tree
 
-from minimidl.parser import parse_idl
+from minimidl.parser import IDLParser, parse_idl
 
 
 class TestBasicParsing:
@@ -445,3 +445,29 @@ class TestErrorHandling:
         """
         tree = parse_idl(idl, transform=False)
         assert tree is not None
+
+
+class TestParserReuse:
+    """Test sharing of the compiled grammar between parsers."""
+
+    def test_parsers_share_grammar(self) -> None:
+        """Test that separate parsers reuse one Lark instance."""
+        first = IDLParser()
+        second = IDLParser()
+        assert first._parser is second._parser
+        assert first._transformer is not second._transformer
+
+    def test_keywords_as_identifiers(self) -> None:
+        """Test that keywords not valid at a position lex as identifiers."""
+        idl = """
+        namespace Test {
+            interface IExample {
+                int32_t set;
+                void Update(string_t dict);
+            }
+        }
+        """
+        ast = IDLParser().parse(idl)
+        interface = ast.namespaces[0].interfaces[0]
+        assert interface.properties[0].name == "set"
+        assert interface.methods[0].parameters[0].name == "dict"
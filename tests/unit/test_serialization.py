@@ -228,7 +228,7 @@ class TestSerialization:
             f.write(b"invalid json{")
 
         try:
-            with pytest.raises(json.JSONDecodeError):
+            with pytest.raises(ValueError, match="Invalid JSON"):
                 load_ast(temp_path)
         finally:
             temp_path.unlink()
@@ -263,3 +263,33 @@ class TestSerialization:
             # Verify it can be loaded
             ast2 = load_ast(path)
             assert ast == ast2
+
+    def test_default_fields_omitted(self) -> None:
+        """Test that empty default lists are left out of the saved JSON."""
+        ast = parse_idl("namespace Test { interface IUser; }")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ast.json"
+            save_ast(ast, path)
+
+            with open(path) as f:
+                data = json.load(f)
+            namespace = data["namespaces"][0]
+            assert "forward_declarations" in namespace
+            assert "interfaces" not in namespace
+
+            # Defaults are restored on load
+            ast2 = load_ast(path)
+            assert ast2.namespaces[0].interfaces == []
+            assert ast == ast2
+
+    def test_union_tag_follows_exclude_options(self) -> None:
+        """Test that kind is kept with exclude_defaults but honours exclude."""
+        ast = parse_idl("namespace Test { typedef int32_t[] Ids; }")
+        typedef_type = ast.namespaces[0].typedefs[0].type
+
+        assert typedef_type.model_dump(exclude_defaults=True)["kind"] == "array"
+        assert "kind" not in typedef_type.model_dump(exclude={"kind"})
+        assert "kind" not in typedef_type.model_dump(
+            exclude_defaults=True, exclude={"kind"}
+        )
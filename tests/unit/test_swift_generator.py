@@ -98,6 +98,24 @@ class TestSwiftTypeMapping:
         )
         assert generator.is_array(PrimitiveType(name="int32_t")) == False
 
+    def test_cached_filters_follow_enum_names(self, generator):
+        """Test that cached filter results are dropped when enum names change."""
+        type_ref = NullableType(inner_type=TypeRef(name="ILevel"))
+        assert generator.swift_type(type_ref) == "Level?"
+        assert generator.is_interface(type_ref)
+
+        generator.enum_names = frozenset({"ILevel"})
+        assert generator.swift_type(type_ref) == "ILevel?"
+        assert generator.is_enum(type_ref)
+        assert not generator.is_interface(type_ref)
+
+    def test_string_filters(self, generator):
+        """Test the string helper filters registered on the environment."""
+        filters = generator.jinja_env.filters
+        assert filters["capitalize"]("taskName") == "TaskName"
+        assert filters["capitalize"]("") == ""
+        assert filters["lower"]("TaskManager") == "taskmanager"
+
 
 class TestSwiftGeneration:
     """Test Swift code generation."""
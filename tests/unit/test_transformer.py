@@ -307,4 +307,91 @@ class TestIDLTransformer:
         
         assert isinstance(result, EnumValue)
         assert result.name == "SUCCESS"
-        assert result.value.value == 0
\ No newline at end of file
+        assert result.value.value == 0
+
+    def test_enum_decl_rejects_invalid_backing_type(self):
+        """Test that enum_decl still enforces the backing type whitelist."""
+        transformer = IDLTransformer()
+
+        name_token = Token("IDENTIFIER", "Color")
+
+        with pytest.raises(ValueError, match="Invalid enum backing type"):
+            transformer.enum_decl([name_token, PrimitiveType(name="double"), []])
+
+    def test_const_decl_rejects_invalid_type(self):
+        """Test that const_decl still enforces the constant type whitelist."""
+        transformer = IDLTransformer()
+
+        name_token = Token("IDENTIFIER", "FLAG")
+
+        with pytest.raises(ValueError, match="Invalid constant type"):
+            transformer.const_decl(
+                [PrimitiveType(name="bool"), name_token, LiteralExpression(value=1)]
+            )
+
+    def test_primitive_types_are_shared(self):
+        """Test that primitive type nodes are reused across occurrences."""
+        transformer = IDLTransformer()
+
+        first = transformer.primitive_type([Token("INT32", "int32_t")])
+        second = transformer.primitive_type([Token("INT32", "int32_t")])
+
+        assert first is second
+        assert first.name == "int32_t"
+        assert transformer.string_type([]) is transformer.string_type([])
+
+    def test_type_refs_are_shared_within_a_tree(self):
+        """Test that repeated type references reuse one TypeRef per tree."""
+        from minimidl import parse_idl
+
+        ast = parse_idl(
+            """
+            namespace Test {
+                interface IUser;
+                interface IGroup {
+                    IUser Owner;
+                    IUser GetMember(int32_t index);
+                }
+            }
+            """
+        )
+
+        interface = ast.namespaces[0].interfaces[0]
+        assert interface.properties[0].type is interface.methods[0].return_type
+        assert interface.properties[0].type == TypeRef(name="IUser")
+
+    def test_operator_chains_keep_their_operators(self):
+        """Test that three-operand chains fold left with their operators."""
+        from minimidl import parse_idl
+        from minimidl.generators.cpp import CppGenerator
+
+        generator = CppGenerator()
+        cases = {
+            "1 + 2 - 3": "((1 + 2) - 3)",
+            "1 << 2 >> 3": "((1 << 2) >> 3)",
+            "2 * 3 % 4": "((2 * 3) % 4)",
+        }
+        for source, rendered in cases.items():
+            ast = parse_idl(f"namespace Test {{ const int32_t F = {source}; }}")
+            expr = ast.namespaces[0].constants[0].constant_value.value
+
+            assert isinstance(expr, BinaryExpression)
+            assert isinstance(expr.operator, str)
+            assert generator.render_expression(expr) == rendered
+
+    def test_two_operand_expressions_keep_both_operands(self):
+        """Test that a single binary operator keeps its right operand."""
+        from minimidl import parse_idl
+        from minimidl.generators.cpp import CppGenerator
+
+        generator = CppGenerator()
+        cases = {
+            "1 + 2": "(1 + 2)",
+            "(1 + 2) * 3 - 4": "(((1 + 2) * 3) - 4)",
+            "-1 << 4": "(-1 << 4)",
+        }
+        for source, rendered in cases.items():
+            ast = parse_idl(f"namespace Test {{ const int32_t F = {source}; }}")
+            expr = ast.namespaces[0].constants[0].constant_value.value
+
+            assert generator.render_expression(expr) == rendered
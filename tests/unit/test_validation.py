@@ -4,6 +4,7 @@ import pytest
 
 from minimidl import parse_idl
 from minimidl.ast import ValidationError, validate_ast
+from minimidl.ast.validator import SemanticValidator
 
 
 class TestSemanticValidation:
@@ -242,6 +243,26 @@ class TestSemanticValidation:
         with pytest.raises(ValidationError, match="Unknown type 'IUser'"):
             validate_ast(ast)
 
+    def test_same_type_name_in_different_namespaces(self) -> None:
+        """Test that equal type names in different namespaces do not clash."""
+        idl = """
+        namespace First {
+            interface IUser;
+            interface IUser {
+                IUser GetSelf();
+            }
+        }
+
+        namespace Second {
+            interface IUser {
+                IUser GetSelf();
+            }
+        }
+        """
+        ast = parse_idl(idl)
+        # Should not raise
+        validate_ast(ast)
+
     def test_enum_and_typedef_references(self) -> None:
         """Test that enums and typedefs can be referenced."""
         idl = """
@@ -298,3 +319,58 @@ class TestSemanticValidation:
         assert "UnknownType1" in error_msg
         assert "UnknownType2" in error_msg
         assert "UnknownType3" in error_msg
+
+    def test_collected_errors_keep_node_and_message(self) -> None:
+        """Test that collected errors carry their node and message."""
+        idl = """
+        namespace Test {
+            interface IUser {
+                UnknownType GetValue();
+            }
+        }
+        """
+        ast = parse_idl(idl)
+        validator = SemanticValidator()
+
+        with pytest.raises(ValidationError):
+            validator.validate(ast)
+
+        (error,) = validator.errors
+        assert error.node is ast.namespaces[0].interfaces[0].methods[0].return_type
+        assert str(error) == "Unknown type 'UnknownType' in return type of GetValue"
+
+    def test_error_accepts_node_positionally(self) -> None:
+        """Test that ValidationError(message, node) keeps the node."""
+        node = object()
+        error = ValidationError("Unknown type 'Foo'", node)
+
+        assert error.node is node
+        assert error.args == ("Unknown type 'Foo'",)
+        assert str(error) == "Unknown type 'Foo'"
+
+    def test_errors_reported_in_member_order(self) -> None:
+        """Test that interface errors follow the declaration order of members."""
+        idl = """
+        namespace Test {
+            interface IUser {
+                UnknownA GetName();
+                string_t GetName();
+                UnknownB GetOther();
+                UnknownC Label;
+                string_t Label;
+            }
+        }
+        """
+        ast = parse_idl(idl)
+        validator = SemanticValidator()
+
+        with pytest.raises(ValidationError):
+            validator.validate(ast)
+
+        assert [str(error) for error in validator.errors] == [
+            "Unknown type 'UnknownA' in return type of GetName",
+            "Duplicate method name 'GetName' in interface IUser",
+            "Unknown type 'UnknownB' in return type of GetOther",
+            "Unknown type 'UnknownC' in property Label",
+            "Duplicate property name 'Label' in interface IUser",
+        ]
@@ -1,11 +1,13 @@
 """Unit tests for workflow modules."""
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from minimidl.ast.nodes import IDLFile, Interface, Method, Namespace, PrimitiveType
+from minimidl.generators.base import write_files
 from minimidl.workflows.cpp_workflow import CppWorkflow
 from minimidl.workflows.swift_workflow import SwiftWorkflow
 
@@ -112,6 +114,32 @@ class TestCppWorkflow:
         project_dir = tmp_path / "CustomName"
         assert project_dir.exists()
 
+    def test_write_files(self, tmp_path):
+        """Test that batched writes create directories and keep their order."""
+        files = [(tmp_path / "nested" / f"file{i}.txt", f"content {i}") for i in range(5)]
+
+        paths = write_files(files)
+
+        assert paths == [path for path, _ in files]
+        for path, content in files:
+            assert path.read_text() == content
+
+    def test_regeneration_skips_unchanged_files(self, simple_ast, tmp_path):
+        """Test that regenerating a project leaves unchanged files untouched."""
+        workflow = CppWorkflow()
+        files = workflow.generate_project(simple_ast, tmp_path)
+        readme = tmp_path / "Test" / "README.md"
+        assert readme in files
+
+        # Backdate the file so a rewrite would be visible
+        os.utime(readme, (1_000_000, 1_000_000))
+        workflow.generate_project(simple_ast, tmp_path)
+        assert readme.stat().st_mtime == 1_000_000
+
+        readme.write_text("stale")
+        workflow.generate_project(simple_ast, tmp_path)
+        assert "# Test" in readme.read_text()
+
 
 class TestSwiftWorkflow:
     """Test Swift workflow."""
@@ -150,6 +178,7 @@ class TestSwiftWorkflow:
         assert workflow.config == {}
         assert workflow.swift_generator is not None
         assert workflow.c_wrapper_generator is not None
+        assert workflow.swift_generator.c_gen is workflow.c_wrapper_generator
 
     def test_generate_project_structure(self, simple_ast, tmp_path):
         """Test Swift project structure generation."""